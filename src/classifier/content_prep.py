@@ -135,32 +135,22 @@ def truncate_content_by_pages(
             return content, None
         return truncated, _headerless_truncation_note(headerless_char_limit)
 
-    page_numbers = _extract_page_numbers(matches)
     total_pages = len(matches)
     if total_pages <= max_pages:
-        return body + footer, None
-
-    # Slice the body into per-page segments.
-    # The first segment starts at 0 (capturing any preamble before the first
-    # page header); subsequent segments start at their header's match position.
-    segments: list[str] = []
-    for idx, match in enumerate(matches):
-        start = 0 if idx == 0 else match.start()
-        end = matches[idx + 1].start() if idx + 1 < len(matches) else len(body)
-        segments.append(body[start:end])
-
-    # Build the set of page indices to include (head + tail)
-    include = set(range(min(max_pages, total_pages)))
-    tail_pages = max(0, tail_pages)
-    if tail_pages:
-        tail_start = max(total_pages - tail_pages, 0)
-        include.update(range(tail_start, total_pages))
-
-    include_indices = sorted(include)
-    if len(include_indices) >= total_pages:
-        return body + footer, None
-
-    truncated_body = "".join(segments[index] for index in include_indices)
-    included_pages = [page_numbers[index] for index in include_indices]
+        return content, None
+
+    # Head and tail are two contiguous page runs, so the kept text is at most
+    # two slices of the body. The head starts at 0 to keep any preamble
+    # before the first page header.
+    head_count = min(max_pages, total_pages)
+    tail_start = max(total_pages - max(0, tail_pages), head_count)
+    if tail_start == head_count and tail_pages > 0:
+        # The tail reaches back into the head: every page is kept.
+        return content, None
+
+    head = body[: matches[head_count].start()]
+    tail = body[matches[tail_start].start() :] if tail_start < total_pages else ""
+    page_numbers = _extract_page_numbers(matches)
+    included_pages = page_numbers[:head_count] + page_numbers[tail_start:]
     note = _page_truncation_note(included_pages, total_pages)
-    return truncated_body + footer, note
+    return head + tail + footer, note
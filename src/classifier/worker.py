@@ -104,6 +104,7 @@ class ClassificationProcessor(ErrorFinaliserMixin):
                 doc_id=self.doc_id,
                 tag_id=self.settings.CLASSIFY_PROCESSING_TAG_ID,
                 purpose="classification",
+                latest=document,
             )
             if not claimed:
                 return
@@ -137,6 +138,9 @@ class ClassificationProcessor(ErrorFinaliserMixin):
             if usable is None:
                 return
             self._apply_classification(document, current_tags, content, usable, model)
+            # The metadata write swapped every pipeline tag — the lock included
+            # — for the post tag, so there is nothing left to release.
+            claimed = False
         finally:
             if claimed:
                 release_processing_tag(
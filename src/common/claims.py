@@ -16,25 +16,31 @@ def claim_processing_tag(
     doc_id: int,
     tag_id: int | None,
     purpose: str,
+    latest: dict | None = None,
 ) -> bool:
     """Add a processing-lock tag and verify it persists (best-effort lock).
 
     Returns ``True`` on success, ``False`` if already claimed or on error.
     Returns ``True`` immediately when *tag_id* is ``None`` (lock not configured).
+
+    *latest* is the document as the caller fetched it immediately before
+    claiming; passing it skips the pre-claim refresh, which would only
+    repeat that GET. The post-claim verification always re-reads Paperless.
     """
     if tag_id is None:
         return True
 
-    try:
-        latest = client.get_document(doc_id)
-    except PAPERLESS_CALL_EXCEPTIONS:
-        log.exception(
-            "Failed to refresh document before claiming processing tag",
-            doc_id=doc_id,
-            processing_tag_id=tag_id,
-            purpose=purpose,
-        )
-        return False
+    if latest is None:
+        try:
+            latest = client.get_document(doc_id)
+        except PAPERLESS_CALL_EXCEPTIONS:
+            log.exception(
+                "Failed to refresh document before claiming processing tag",
+                doc_id=doc_id,
+                processing_tag_id=tag_id,
+                purpose=purpose,
+            )
+            return False
 
     current_tags = extract_tags(latest, doc_id=doc_id, context=f"{purpose}-claim")
     if tag_id in current_tags:
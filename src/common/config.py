@@ -535,7 +535,9 @@ def _build_settings(source: Mapping[str, str]) -> Settings:
         REQUEST_TIMEOUT=_get_int_env(source, "REQUEST_TIMEOUT", 180),
         LLM_MAX_CONCURRENT=max(0, _get_int_env(source, "LLM_MAX_CONCURRENT", 0)),
         OCR_DPI=_get_int_env(source, "OCR_DPI", 300),
-        OCR_MAX_SIDE=_get_int_env(source, "OCR_MAX_SIDE", 1600),
+        OCR_MAX_SIDE=_require_at_least_one(
+            "OCR_MAX_SIDE", _get_int_env(source, "OCR_MAX_SIDE", 1600)
+        ),
         PAGE_WORKERS=max(1, _get_int_env(source, "PAGE_WORKERS", 8)),
         DOCUMENT_WORKERS=max(1, _get_int_env(source, "DOCUMENT_WORKERS", 4)),
         LOG_LEVEL=source.get("LOG_LEVEL", "INFO").upper(),
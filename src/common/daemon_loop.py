@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import time
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -39,33 +40,30 @@ class CycleOutcome:
 def _process_batch(
     items: list[T],
     process_item: Callable[[T], None],
-    max_workers: int,
+    executor: ThreadPoolExecutor,
     daemon_name: str,
 ) -> None:
-    """Process a batch of work items concurrently using a thread pool.
+    """Process a batch of work items concurrently on *executor*.
 
-    Exceptions raised while processing one item are logged but do not
-    prevent other items from completing.
+    Blocks until every item has finished. Exceptions raised while processing
+    one item are logged but do not prevent other items from completing.
     """
-    with ThreadPoolExecutor(
-        max_workers=max_workers, thread_name_prefix=f"{daemon_name}-worker"
-    ) as executor:
-        future_to_item = {executor.submit(process_item, item): item for item in items}
-        for future in as_completed(future_to_item):
-            item = future_to_item[future]
-            try:
-                future.result()
-            except Exception:
-                # rationale: per-document worker-dispatch boundary
-                # (CODE_GUIDELINES §6.4, site 2) — one document's failure is
-                # logged with its traceback and isolated so the rest of the
-                # batch still completes. The traceback is attached via
-                # log.exception.
-                log.exception(
-                    "Work item failed",
-                    daemon=daemon_name,
-                    item=_safe_item_summary(item),
-                )
+    future_to_item = {executor.submit(process_item, item): item for item in items}
+    for future in as_completed(future_to_item):
+        item = future_to_item[future]
+        try:
+            future.result()
+        except Exception:
+            # rationale: per-document worker-dispatch boundary
+            # (CODE_GUIDELINES §6.4, site 2) — one document's failure is
+            # logged with its traceback and isolated so the rest of the
+            # batch still completes. The traceback is attached via
+            # log.exception.
+            log.exception(
+                "Work item failed",
+                daemon=daemon_name,
+                item=_safe_item_summary(item),
+            )
 
 
 def _poll_once(
@@ -73,6 +71,7 @@ def _poll_once(
     daemon_name: str,
     fetch_work: Callable[[], list[T]],
     process_item: Callable[[T], None],
+    executor: ThreadPoolExecutor,
     max_workers: int,
     before_each_batch: Callable[[list[T]], None] | None,
     was_idle: bool,
@@ -94,7 +93,7 @@ def _poll_once(
         max_workers=max_workers,
     )
 
-    _process_batch(items, process_item, max_workers, daemon_name)
+    _process_batch(items, process_item, executor, daemon_name)
     return CycleOutcome(processed=len(items), idle=False)
 
 
@@ -130,40 +129,73 @@ def run_polling_threadpool(
     poll_interval_seconds = max(1, int(poll_interval_seconds))
     max_workers = max(1, int(max_workers))
 
-    was_idle = False
-    while not is_shutdown_requested():
-        if before_each_poll is not None:
-            before_each_poll()
-        try:
-            outcome = _poll_once(
+    # One pool for the loop's life: its worker threads are started on the
+    # first busy poll and reused by every later batch rather than spawned and
+    # joined per poll. Each batch still completes before the next poll.
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix=f"{daemon_name}-worker"
+    ) as executor:
+        poll = functools.partial(
+            _poll_once,
+            daemon_name=daemon_name,
+            fetch_work=fetch_work,
+            process_item=process_item,
+            executor=executor,
+            max_workers=max_workers,
+            before_each_batch=before_each_batch,
+        )
+        was_idle = False
+        while not is_shutdown_requested():
+            if before_each_poll is not None:
+                before_each_poll()
+            was_idle = _run_cycle(
+                poll,
+                was_idle,
                 daemon_name=daemon_name,
-                fetch_work=fetch_work,
-                process_item=process_item,
-                max_workers=max_workers,
-                before_each_batch=before_each_batch,
-                was_idle=was_idle,
-            )
-            was_idle = outcome.idle
-            _run_on_cycle(on_cycle, outcome, daemon_name)
-            sleep(poll_interval_seconds)
-        except _DAEMON_LOOP_EXCEPTIONS as exc:
-            # An expected, recoverable anomaly: a transient Paperless network
-            # or API failure. WARNING (not ERROR) per §7.3; exc_info=True
-            # attaches the traceback — log.error(str(exc)) would discard it
-            # (§7.5). The loop sleeps and the next poll retries.
-            log.warning(
-                "Transient error in daemon loop; sleeping before retry",
-                daemon=daemon_name,
                 poll_interval_seconds=poll_interval_seconds,
-                error=str(exc),
-                error_type=type(exc).__name__,
-                exc_info=True,
+                on_cycle=on_cycle,
+                sleep=sleep,
             )
-            sleep(poll_interval_seconds)
 
     log.info("Shutdown requested; exiting gracefully", daemon=daemon_name)
 
 
+def _run_cycle(
+    poll: Callable[..., CycleOutcome],
+    was_idle: bool,
+    *,
+    daemon_name: str,
+    poll_interval_seconds: int,
+    on_cycle: Callable[[CycleOutcome], None] | None,
+    sleep: Callable[[float], None],
+) -> bool:
+    """Run one poll iteration, report it, and sleep until the next.
+
+    Returns whether the loop is now idle. A transient failure leaves that
+    state as it was, so the next poll simply retries.
+    """
+    try:
+        outcome = poll(was_idle=was_idle)
+        _run_on_cycle(on_cycle, outcome, daemon_name)
+        sleep(poll_interval_seconds)
+        return outcome.idle
+    except _DAEMON_LOOP_EXCEPTIONS as exc:
+        # An expected, recoverable anomaly: a transient Paperless network or
+        # API failure. WARNING (not ERROR) per §7.3; exc_info=True attaches
+        # the traceback — log.error(str(exc)) would discard it (§7.5). The
+        # loop sleeps and the next poll retries.
+        log.warning(
+            "Transient error in daemon loop; sleeping before retry",
+            daemon=daemon_name,
+            poll_interval_seconds=poll_interval_seconds,
+            error=str(exc),
+            error_type=type(exc).__name__,
+            exc_info=True,
+        )
+        sleep(poll_interval_seconds)
+        return was_idle
+
+
 def _run_on_cycle(
     on_cycle: Callable[[CycleOutcome], None] | None,
     outcome: CycleOutcome,
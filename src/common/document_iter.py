@@ -7,7 +7,7 @@ from typing import Generator
 import structlog
 
 from .paperless import PaperlessClient
-from .tags import extract_tags, remove_stale_queue_tag
+from .tags import extract_tags, remove_stale_queue_tags
 
 log = structlog.get_logger(__name__)
 
@@ -28,7 +28,8 @@ def iter_documents_by_pipeline_tag(
     1. Fetch documents by the *pre* (queue) tag.
     2. Skip documents without an integer ``id``.
     3. Skip already-processed documents (those carrying the *post* tag),
-       removing the stale *pre* tag as a side-effect.
+       removing the stale *pre* tag as a side-effect — in one bulk request
+       once the listing is exhausted, not one PATCH per document.
     4. Skip documents already claimed by another worker (carrying the
        *processing* tag).
 
@@ -39,6 +40,7 @@ def iter_documents_by_pipeline_tag(
         processing_tag_id: The processing-lock tag.  ``None`` or ``0`` to disable.
         context:          Short label for log context (e.g. ``"ocr-iter"``).
     """
+    stale_doc_ids: list[int] = []
     for doc in client.get_documents_by_tag(pre_tag_id):
         doc_id = doc.get("id")
         if not isinstance(doc_id, int):
@@ -50,13 +52,7 @@ def iter_documents_by_pipeline_tag(
         # Already processed — remove the stale queue tag
         if post_tag_id is not None and post_tag_id in tags:
             if pre_tag_id in tags:
-                remove_stale_queue_tag(
-                    client,
-                    doc_id,
-                    tags,
-                    pre_tag_id=pre_tag_id,
-                    processing_tag_id=processing_tag_id,
-                )
+                stale_doc_ids.append(doc_id)
             continue
 
         # Already claimed by another worker
@@ -64,3 +60,10 @@ def iter_documents_by_pipeline_tag(
             continue
 
         yield doc
+
+    remove_stale_queue_tags(
+        client,
+        stale_doc_ids,
+        pre_tag_id=pre_tag_id,
+        processing_tag_id=processing_tag_id,
+    )
@@ -60,6 +60,28 @@ def _close_active_http_client() -> None:
         client.close()
 
 
+# httpx's own ceiling on open connections; the pool never goes below it.
+_MIN_MAX_CONNECTIONS = 100
+
+
+def _llm_pool_limits(settings: Settings) -> httpx.Limits:
+    """Size the LLM connection pool to the process's peak concurrent calls.
+
+    httpx keeps only 20 idle connections by default — fewer than the default
+    ``DOCUMENT_WORKERS x PAGE_WORKERS`` (32) concurrent vision calls — so each
+    burst past 20 dropped the surplus connections and the next burst paid a
+    fresh TCP + TLS handshake per page. ``LLM_MAX_CONCURRENT``, when set,
+    lowers the peak to the global limiter's cap.
+    """
+    peak = settings.DOCUMENT_WORKERS * settings.PAGE_WORKERS
+    if settings.LLM_MAX_CONCURRENT > 0:
+        peak = min(peak, settings.LLM_MAX_CONCURRENT)
+    return httpx.Limits(
+        max_connections=max(peak, _MIN_MAX_CONNECTIONS),
+        max_keepalive_connections=peak,
+    )
+
+
 def setup_libraries(settings: Settings) -> None:
     """Configure Pillow and build the shared LLM OpenAI client singleton.
 
@@ -91,7 +113,7 @@ def setup_libraries(settings: Settings) -> None:
         # OpenAI's SDK uses httpx internally.  In container environments it
         # is common to have proxy env-vars set unintentionally; explicitly
         # opting out of environment-based trust avoids surprising behaviour.
-        http_client = httpx.Client(trust_env=False)
+        http_client = httpx.Client(trust_env=False, limits=_llm_pool_limits(settings))
         _active_http_client = http_client
         if not _atexit_registered:
             # Register exactly once. The callback closes whichever client is
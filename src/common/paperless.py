@@ -384,7 +384,9 @@ class PaperlessClient:
         self, doc_id: int, content: str, new_tags: Iterable[int]
     ) -> None:
         url = f"{self.settings.PAPERLESS_URL}/api/documents/{doc_id}/"
-        tags_list = list(new_tags)
+        # Sorted so the same tag set always produces the same payload and
+        # log line, whatever set iteration order the caller's mutations left.
+        tags_list = sorted(new_tags)
         log.info(
             "Updating document",
             doc_id=doc_id,
@@ -457,7 +459,7 @@ class PaperlessClient:
                 # rationale: `value` is `int | str | list[int] | None` from the
                 # TypedDict union; mypy cannot narrow to Iterable[int] here even
                 # though the runtime branch guarantees it when key == "tags".
-                value = list(value)  # type: ignore[call-overload]
+                value = sorted(value)  # type: ignore[call-overload]
             payload[api_field] = value
 
         if not payload:
@@ -663,5 +665,26 @@ class PaperlessClient:
         response = self._delete(url, params={"id": str(note_id)})
         response.raise_for_status()
 
+    def bulk_remove_tags(self, doc_ids: Iterable[int], tag_ids: Iterable[int]) -> None:
+        """Remove *tag_ids* from every document in *doc_ids* in one request.
+
+        Uses the ``bulk_edit`` ``modify_tags`` method, which Paperless applies
+        server-side per document — each document keeps every other tag, with
+        no read-modify-write race against concurrent tag edits.
+
+        Raises:
+            httpx.HTTPStatusError: On a non-2xx response.
+        """
+        url = f"{self.settings.PAPERLESS_URL}/api/documents/bulk_edit/"
+        documents = sorted(doc_ids)
+        log.info("paperless.bulk_remove_tags", document_count=len(documents))
+        payload = {
+            "documents": documents,
+            "method": "modify_tags",
+            "parameters": {"add_tags": [], "remove_tags": sorted(tag_ids)},
+        }
+        response = self._post(url, json=payload)
+        response.raise_for_status()
+
     def close(self) -> None:
         self._client.close()
@@ -51,31 +51,36 @@ def get_latest_tags(
     return extract_tags(latest, doc_id=doc_id, context=context)
 
 
-def remove_stale_queue_tag(
+def remove_stale_queue_tags(
     client: PaperlessClient,
-    doc_id: int,
-    tags: set[int],
+    doc_ids: list[int],
     *,
     pre_tag_id: int,
     processing_tag_id: int | None = None,
 ) -> None:
-    """Remove queue/processing tags that should no longer be on a document."""
-    updated = set(tags)
-    updated.discard(pre_tag_id)
+    """Remove queue/processing tags from already-processed documents in one call.
+
+    A user re-queuing a batch of finished documents would otherwise cost one
+    PATCH per document on the next poll. Best-effort: a failure is logged and
+    the tags are retried on the next poll, when the documents are listed again.
+    """
+    if not doc_ids:
+        return
+    stale = {pre_tag_id}
     if processing_tag_id is not None:
-        updated.discard(processing_tag_id)
+        stale.add(processing_tag_id)
     try:
-        client.update_document_metadata(doc_id, tags=updated)
+        client.bulk_remove_tags(doc_ids, stale)
     except PAPERLESS_CALL_EXCEPTIONS:
         log.exception(
-            "Failed to remove stale queue tag",
-            doc_id=doc_id,
+            "Failed to remove stale queue tags",
+            doc_ids=doc_ids,
             pre_tag_id=pre_tag_id,
         )
     else:
         log.info(
-            "Removed stale queue tag from already-processed document",
-            doc_id=doc_id,
+            "Removed stale queue tag from already-processed documents",
+            doc_ids=doc_ids,
             pre_tag_id=pre_tag_id,
         )
 
@@ -16,8 +16,8 @@ Paperless HTTP through ``common.paperless``, LLM calls through ``common.llm``.
 
 from __future__ import annotations
 
-from .image_converter import ImageConversionError, bytes_to_images
-from .provider import OcrProvider
+from .image_converter import ImageConversionError, bytes_to_images, iter_pdf_pages
+from .provider import OcrProvider, OcrProviderUnavailableError
 from .text_assembly import OCR_ERROR_MARKER, PageResult, assemble_full_text
 from .worker import OcrProcessor
 
@@ -26,7 +26,9 @@ __all__ = [
     "OCR_ERROR_MARKER",
     "OcrProcessor",
     "OcrProvider",
+    "OcrProviderUnavailableError",
     "PageResult",
     "assemble_full_text",
     "bytes_to_images",
+    "iter_pdf_pages",
 ]
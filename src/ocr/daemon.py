@@ -12,7 +12,8 @@ is the ``appdb`` read inside the shared bootstrap and the hot-load accessor.
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from typing import Iterable
 
 import structlog
@@ -42,11 +43,22 @@ class _DaemonState:
     ``fetch_work`` / ``process_item`` close over this holder rather than a
     bare ``Settings``, so a hot-reload between polls is picked up by the next
     poll without rebuilding the loop (web-redesign §5).
+
+    ``provider_outage`` is set by the first document of a poll to find the
+    vision provider down, so the rest of that batch is skipped; it is cleared
+    before every poll, which retries the provider once per poll interval.
     """
 
     settings: Settings
     list_client: PaperlessClient
     app_db_path: str
+    provider_outage: threading.Event = field(default_factory=threading.Event)
+
+
+def _before_poll(state: _DaemonState) -> None:
+    """The before-each-poll hook: reset the outage flag, then hot-reload."""
+    state.provider_outage.clear()
+    _reload_if_changed(state)
 
 
 def _reload_if_changed(state: _DaemonState) -> None:
@@ -76,13 +88,21 @@ def _reload_if_changed(state: _DaemonState) -> None:
     state.list_client = PaperlessClient(latest)
 
 
-def _process_document(doc: dict, settings: Settings) -> None:
+def _process_document(
+    doc: dict,
+    settings: Settings,
+    provider_outage: threading.Event | None = None,
+) -> None:
     """Process a single Paperless document with its own HTTP session and provider."""
     run_per_document(
         doc,
         settings,
         lambda d, paperless: OcrProcessor(
-            d, paperless, OcrProvider(settings), settings
+            d,
+            paperless,
+            OcrProvider(settings),
+            settings,
+            provider_outage=provider_outage,
         ),
     )
 
@@ -152,10 +172,12 @@ def main() -> None:
             fetch_work=lambda: list(
                 _iter_docs_to_ocr(state.list_client, state.settings)
             ),
-            process_item=lambda doc: _process_document(doc, state.settings),
+            process_item=lambda doc: _process_document(
+                doc, state.settings, state.provider_outage
+            ),
             poll_interval_seconds=state.settings.POLL_INTERVAL,
             max_workers=state.settings.DOCUMENT_WORKERS,
-            before_each_poll=lambda: _reload_if_changed(state),
+            before_each_poll=lambda: _before_poll(state),
             on_cycle=_on_cycle,
         )
     finally:
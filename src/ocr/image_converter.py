@@ -2,10 +2,40 @@
 
 from __future__ import annotations
 
+import math
+import os
+import re
+import tempfile
+from collections.abc import Iterator
 from io import BytesIO
+from typing import cast
 
-from PIL import Image, ImageSequence, UnidentifiedImageError
-from pdf2image import convert_from_bytes
+from PIL import ExifTags, Image, ImageSequence, UnidentifiedImageError
+from pdf2image import convert_from_path, pdfinfo_from_path
+
+# Pages rendered per convert_from_path call when a PDF is streamed. At 300
+# DPI an A4 page is ~25 MB of RGB pixels, so this bounds how much of a long
+# scan sits in memory ahead of the OCR workers. The price is per chunk:
+# pdf2image runs ``pdfinfo``, ``pdftoppm -v`` and one ``pdftoppm`` per
+# thread, each opening the PDF afresh. That is a few process starts per ten
+# pages, against ten vision calls of seconds each, and chunks render while
+# the previous one is still being OCR'd. Not benchmarked against real Poppler;
+# lower it only with a measurement, since the start-up share grows as it does.
+PDF_CHUNK_PAGES = 10
+
+# EXIF orientation 1: the pixels are stored upright, no rotation or flip.
+_EXIF_UPRIGHT = 1
+
+# PDF user-space units per inch: pdfinfo reports page sizes in points.
+_POINTS_PER_INCH = 72
+
+# ``pdfinfo -l`` past the last page is clamped to it, so this reports every
+# page without knowing the count up front (it is parsed as a C int).
+_ALL_PAGES = 2**31 - 1
+
+# ``pdfinfo -f/-l`` prints one ``Page    N size: W x H pts (...)`` line per page.
+_PAGE_SIZE_KEY_RE = re.compile(r"^Page\s+(\d+)\s+size$")
+_PAGE_SIZE_VALUE_RE = re.compile(r"^([\d.]+) x ([\d.]+) pts")
 
 
 class ImageConversionError(Exception):
@@ -18,32 +48,32 @@ class ImageConversionError(Exception):
     """
 
 
-def bytes_to_images(
-    content: bytes, content_type: str, *, dpi: int = 300
-) -> list[Image.Image]:
-    """Convert raw document bytes into a list of PIL Images.
+def bytes_to_images(content: bytes, content_type: str) -> list[Image.Image]:
+    """Convert raw image bytes into a list of PIL Images.
 
-    - PDFs are rasterised into one image per page at *dpi* resolution.
     - Image formats (PNG/JPEG/TIFF/...) are loaded via Pillow.
     - Multi-frame images (e.g. TIFF) are expanded into one image per frame.
 
+    PDFs are not accepted: they are rendered lazily, in bounded chunks, by
+    :func:`iter_pdf_pages` — the only PDF path.
+
     All returned images are fully loaded into memory (``Image.load()``) so
     they do not depend on any open file handles.
 
     Args:
         content: The raw file bytes.
-        content_type: MIME type (e.g. ``"application/pdf"``, ``"image/tiff"``).
-        dpi: Resolution for PDF rasterisation (default 300).
+        content_type: MIME type (e.g. ``"image/png"``, ``"image/tiff"``).
 
     Returns:
         A list of PIL Images, one per page/frame.
 
     Raises:
+        ValueError: If *content_type* names a PDF.
         ImageConversionError: If the image bytes cannot be identified by Pillow
             or the file is truncated/corrupt.
     """
-    if "pdf" in content_type.lower():
-        return convert_from_bytes(content, dpi=dpi)
+    if is_pdf(content_type):
+        raise ValueError("PDFs must be rendered with iter_pdf_pages")
 
     try:
         img = Image.open(BytesIO(content))
@@ -60,3 +90,155 @@ def bytes_to_images(
         # OSError covers a truncated or otherwise corrupt image — Pillow
         # identifies the format but fails partway through Image.load().
         raise ImageConversionError(f"Unable to open image: {e}") from e
+
+
+def forwardable_media_type(content: bytes) -> str | None:
+    """Return the MIME type to send *content* under unchanged, or ``None``.
+
+    The type is read from the file's own header by Pillow, not taken from
+    the ``Content-Type`` Paperless reported, so a mislabelled download is
+    never forwarded under the wrong type. Returns ``None`` when Pillow cannot
+    identify the bytes, or when they carry an EXIF orientation other than
+    upright: the decoded page is sent as stored, without that rotation, and
+    a viewer that honours the tag would read the original file differently.
+    """
+    try:
+        with Image.open(BytesIO(content)) as img:
+            orientation = img.getexif().get(ExifTags.Base.Orientation, _EXIF_UPRIGHT)
+            if orientation != _EXIF_UPRIGHT:
+                return None
+            return Image.MIME.get(img.format or "")
+    except (UnidentifiedImageError, OSError):
+        return None
+
+
+def is_pdf(content_type: str) -> bool:
+    """Return ``True`` when *content_type* names a PDF (parameters allowed)."""
+    return "pdf" in content_type.lower()
+
+
+def iter_pdf_pages(
+    content: bytes,
+    *,
+    dpi: int = 300,
+    thread_count: int = 1,
+    chunk_pages: int = PDF_CHUNK_PAGES,
+    max_side: int | None = None,
+) -> Iterator[Image.Image]:
+    """Rasterise a PDF lazily, *chunk_pages* pages per ``pdftoppm`` call.
+
+    Unlike :func:`bytes_to_images`, the whole document is never held at
+    once: the next chunk is only rendered once the caller has consumed the
+    previous one. The PDF is written to one temporary file that every chunk
+    renders from, removed when the iterator is exhausted or closed; closing
+    it early also closes the current chunk's pages not yet yielded. The file
+    is written and probed eagerly, so a PDF Poppler cannot open fails here
+    rather than on first iteration.
+
+    Args:
+        content: The raw PDF bytes.
+        dpi: Rasterisation resolution, and the ceiling when *max_side* is set.
+        thread_count: Number of ``pdftoppm`` processes each chunk is split
+            across.
+        chunk_pages: Pages rendered per call.
+        max_side: The longest side, in pixels, the pages will be downsized to
+            downstream. When set, each chunk is rendered at the highest DPI
+            at which its smallest page still fits *max_side* — 136 DPI for an
+            A4 page at the defaults, not 300 — so no pixels are rendered
+            only to be thrown away.
+
+    Returns:
+        An iterator of PIL Images, one per page, in page order.
+    """
+    pages = _render_pdf(content, dpi, thread_count, chunk_pages, max_side)
+    # Run the generator up to its first yield: the temp file is written and
+    # probed now, and from here on its ``finally`` removes the file however
+    # iteration ends — an unstarted generator would never run it.
+    next(pages)
+    return cast("Iterator[Image.Image]", pages)
+
+
+def _render_pdf(
+    content: bytes,
+    dpi: int,
+    thread_count: int,
+    chunk_pages: int,
+    max_side: int | None,
+) -> Iterator[Image.Image | None]:
+    """Yield ``None`` once the PDF is written and probed, then its pages."""
+    # The file must outlive this handle: every chunk's pdftoppm reopens it by
+    # name, and the finally below removes it.
+    pdf_file = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)  # noqa: SIM115
+    pdf_path = pdf_file.name
+    try:
+        with pdf_file:
+            pdf_file.write(content)
+        if max_side is None:
+            info = pdfinfo_from_path(pdf_path)
+        else:
+            # One ranged probe reports the page count and every page's size.
+            info = pdfinfo_from_path(pdf_path, first_page=1, last_page=_ALL_PAGES)
+        page_count = int(info["Pages"])
+        long_sides = _page_long_sides(info) if max_side is not None else {}
+        yield None
+        for first_page in range(1, page_count + 1, chunk_pages):
+            last_page = min(first_page + chunk_pages - 1, page_count)
+            chunk_dpi = dpi
+            if max_side is not None:
+                chunk_dpi = _fit_dpi(
+                    [
+                        long_sides[page]
+                        for page in range(first_page, last_page + 1)
+                        if page in long_sides
+                    ],
+                    dpi,
+                    max_side,
+                )
+            chunk = iter(
+                convert_from_path(
+                    pdf_path,
+                    dpi=chunk_dpi,
+                    thread_count=thread_count,
+                    first_page=first_page,
+                    last_page=last_page,
+                )
+            )
+            try:
+                yield from chunk
+            finally:
+                # Closed early: the chunk's pages not yet handed out are
+                # released here rather than left to the garbage collector.
+                for image in chunk:
+                    image.close()
+    finally:
+        os.unlink(pdf_path)
+
+
+def _page_long_sides(info: dict) -> dict[int, float]:
+    """Map each page number in *info* to its longer side, in points."""
+    long_sides: dict[int, float] = {}
+    for key, value in info.items():
+        key_match = _PAGE_SIZE_KEY_RE.match(key)
+        if key_match is None:
+            continue
+        match = _PAGE_SIZE_VALUE_RE.match(str(value))
+        if match is not None:
+            long_sides[int(key_match.group(1))] = max(
+                float(match.group(1)), float(match.group(2))
+            )
+    return long_sides
+
+
+def _fit_dpi(long_sides: list[float], dpi: int, max_side: int) -> int:
+    """Return the highest DPI, capped at *dpi*, that keeps a page in *max_side*.
+
+    Sized on the chunk's smallest page, which comes out at most *max_side*
+    pixels long, so it skips the downstream resize; larger pages in a mixed
+    chunk are still downsized there. Rounded down: rounding up would render
+    an A4 page at 1602 px against a 1600 px limit, and every page would be
+    resized anyway. Falls back to *dpi* when the sizes cannot be read.
+    """
+    if not long_sides or min(long_sides) <= 0:
+        return dpi
+    fitting = math.floor(max_side * _POINTS_PER_INCH / min(long_sides))
+    return max(1, min(dpi, fitting))
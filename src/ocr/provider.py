@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import base64
+from dataclasses import dataclass
 from io import BytesIO
 
 import openai
@@ -18,6 +19,34 @@ from .text_assembly import PageResult
 log = structlog.get_logger(__name__)
 
 
+class OcrProviderUnavailableError(Exception):
+    """Raised when the vision provider itself is down, not just one model.
+
+    An authentication failure or an unreachable endpoint affects every model
+    in the chain equally, so falling back is pointless. The worker aborts the
+    document on this error and leaves it queued for the next poll rather than
+    marking it errored.
+    """
+
+
+# Formats every vision endpoint accepts as-is in an image data URL.
+PASSTHROUGH_CONTENT_TYPES: frozenset[str] = frozenset({"image/jpeg", "image/png"})
+
+
+@dataclass(frozen=True, slots=True)
+class SourceImage:
+    """The original file bytes behind a single-image document's only page.
+
+    When the page already fits within ``OCR_MAX_SIDE`` these bytes are sent
+    to the model unchanged, skipping a copy of the decoded page and a PNG
+    re-encode — for a photographed JPEG the re-encode is also several times
+    larger on the wire than the original.
+    """
+
+    data: bytes
+    content_type: str
+
+
 def is_blank(image: Image.Image, threshold: int = 5) -> bool:
     """Return ``True`` if the image is essentially blank (all white).
 
@@ -47,6 +76,8 @@ class OcrProvider(OpenAIChatMixin):
         image: Image.Image,
         doc_id: int | None = None,
         page_num: int | None = None,
+        *,
+        source: SourceImage | None = None,
     ) -> PageResult:
         """
         Transcribe a single page image using the configured model chain.
@@ -54,6 +85,9 @@ class OcrProvider(OpenAIChatMixin):
         Returns a blank :class:`PageResult` for blank pages and for the case
         where every model refuses or errors — in the latter case the text is
         ``settings.REFUSAL_MARK``.
+
+        *source*, when given, is the file *image* was decoded from; it is sent
+        verbatim if the page needs no resizing.
         """
         log_ctx: dict[str, int] = {}
         if doc_id is not None:
@@ -64,11 +98,7 @@ class OcrProvider(OpenAIChatMixin):
         if is_blank(image):
             return PageResult(text="", model="")
 
-        # Resize large images to reduce token cost and latency. Copy first so
-        # the caller's image is not mutated in-place.
-        image = image.copy()
-        image.thumbnail((self.settings.OCR_MAX_SIDE, self.settings.OCR_MAX_SIDE))
-        payload = _image_to_base64_png(image)
+        data_url = self._image_data_url(image, source)
 
         messages = [
             {"role": "system", "content": TRANSCRIPTION_PROMPT},
@@ -78,7 +108,7 @@ class OcrProvider(OpenAIChatMixin):
                     {
                         "type": "image_url",
                         "image_url": {
-                            "url": f"data:image/png;base64,{payload}",
+                            "url": data_url,
                             "detail": "high",
                         },
                     },
@@ -109,6 +139,11 @@ class OcrProvider(OpenAIChatMixin):
                     self._stats.inc("fallback_successes")
                 return PageResult(text=text, model=model)
             except openai.APIError as e:
+                if _is_provider_outage(e):
+                    self._stats.inc("api_errors")
+                    raise OcrProviderUnavailableError(
+                        f"Vision provider unavailable while calling model {model!r}"
+                    ) from e
                 log.warning(
                     "API call for model failed after all retries",
                     model=model,
@@ -120,6 +155,47 @@ class OcrProvider(OpenAIChatMixin):
         log.error("All models failed or refused to transcribe the page", **log_ctx)
         return PageResult(text=self.settings.REFUSAL_MARK, model="")
 
+    def _image_data_url(self, image: Image.Image, source: SourceImage | None) -> str:
+        """Build the ``data:`` URL for *image*, resized to ``OCR_MAX_SIDE``."""
+        max_side = self.settings.OCR_MAX_SIDE
+        if max(image.size) <= max_side:
+            if source is not None:
+                payload = base64.b64encode(source.data).decode()
+                return f"data:{source.content_type};base64,{payload}"
+        else:
+            # Resize large images to reduce token cost and latency.
+            image = _fit_within(image, max_side)
+        return f"data:image/png;base64,{_image_to_base64_png(image)}"
+
+
+def _is_provider_outage(exc: openai.APIError) -> bool:
+    """Return ``True`` if *exc* would fail identically for every model.
+
+    A rejected API key and a connection that could not be made after all
+    retries are properties of the endpoint, not of the model. A timeout is
+    excluded: a slow model is exactly what the fallback chain is for.
+    """
+    if isinstance(exc, openai.AuthenticationError):
+        return True
+    return isinstance(exc, openai.APIConnectionError) and not isinstance(
+        exc, openai.APITimeoutError
+    )
+
+
+def _fit_within(image: Image.Image, max_side: int) -> Image.Image:
+    """Return a copy of *image* scaled so its longest side is *max_side*.
+
+    Resizes straight from the source rather than ``copy()`` + ``thumbnail()``,
+    which duplicated the full-resolution page (~26 MB for an A4 scan at
+    300 DPI) only to throw it away. ``reducing_gap`` first box-reduces by an
+    integer factor, so LANCZOS — the sharpest filter for small glyphs — runs
+    on a much smaller image. The caller's image is never mutated.
+    """
+    width, height = image.size
+    scale = max_side / max(width, height)
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return image.resize(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+
 
 def _image_to_base64_png(image: Image.Image) -> str:
     buffer = BytesIO()
@@ -3,7 +3,16 @@
 from __future__ import annotations
 
 import datetime as dt
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 
 import structlog
 from PIL import Image
@@ -19,8 +28,19 @@ from common.tags import (
     release_processing_tag,
 )
 from common.content_checks import is_error_content
-from .image_converter import ImageConversionError, bytes_to_images
-from .provider import OcrProvider
+from .image_converter import (
+    ImageConversionError,
+    bytes_to_images,
+    forwardable_media_type,
+    is_pdf,
+    iter_pdf_pages,
+)
+from .provider import (
+    PASSTHROUGH_CONTENT_TYPES,
+    OcrProvider,
+    OcrProviderUnavailableError,
+    SourceImage,
+)
 from .text_assembly import OCR_ERROR_MARKER, PageResult, assemble_full_text
 
 log = structlog.get_logger(__name__)
@@ -30,7 +50,10 @@ class OcrProcessor(ErrorFinaliserMixin):
     """
     Orchestrates the OCR processing of a single Paperless document.
 
-    Instantiated per-document by the daemon's thread pool.
+    Instantiated per-document by the daemon's thread pool. *provider_outage*
+    is shared by every document of one poll: the first document to find the
+    vision provider down sets it, and the rest of the batch is skipped rather
+    than each claiming, downloading and rendering only to fail the same way.
     """
 
     def __init__(
@@ -39,11 +62,14 @@ class OcrProcessor(ErrorFinaliserMixin):
         paperless_client: PaperlessClient,
         ocr_provider: OcrProvider,
         settings: Settings,
+        *,
+        provider_outage: threading.Event | None = None,
     ):
         self.doc = doc
         self.paperless_client = paperless_client
         self.ocr_provider = ocr_provider
         self.settings = settings
+        self.provider_outage = provider_outage
         self.doc_id: int = doc["id"]
         self.title: str = doc.get("title") or "<untitled>"
 
@@ -54,7 +80,17 @@ class OcrProcessor(ErrorFinaliserMixin):
         Steps: refresh → check error tag → claim lock → download →
         convert to images → OCR pages → assemble text → update Paperless →
         release lock.
+
+        A vision-provider outage is expected and recoverable: it is logged
+        once at WARNING, the lock is released, and the document stays queued
+        for the next poll.
         """
+        if self.provider_outage is not None and self.provider_outage.is_set():
+            log.debug(
+                "Vision provider unavailable this poll; skipping document",
+                doc_id=self.doc_id,
+            )
+            return
         log.info("Processing document", doc_id=self.doc_id, title=self.title)
         self.ocr_provider.reset_stats()
         start_time = dt.datetime.now()
@@ -80,33 +116,22 @@ class OcrProcessor(ErrorFinaliserMixin):
                 doc_id=self.doc_id,
                 tag_id=self.settings.OCR_PROCESSING_TAG_ID,
                 purpose="ocr",
+                latest=document,
             )
             if not claimed:
                 return
 
-            images = self._download_and_convert(current_tags)
-            if images is None:
-                return
-
-            try:
-                page_results, failed_pages = self._ocr_pages_in_parallel(images)
-            finally:
-                self._close_images(images)
-
-            if failed_pages:
-                log.warning(
-                    "OCR failed on some pages; marking document as error",
-                    doc_id=self.doc_id,
-                    failed_pages=failed_pages,
-                )
-
-            full_text, models_used = assemble_full_text(
-                len(images),
-                page_results,
-                include_page_models=self.settings.OCR_INCLUDE_PAGE_MODELS,
-            )
-            self._update_paperless_document(full_text, models_used)
-            success = True
+            if self._ocr_and_update(current_tags):
+                # The OCR update swapped every pipeline tag — the lock
+                # included — for the post tag, so there is nothing to release.
+                claimed = False
+                success = True
+        except OcrProviderUnavailableError:
+            # Expected (§6.5): _collect_pages has already logged the outage at
+            # WARNING. Not re-raised, so the daemon loop does not report it
+            # again as a failed work item; the finally releases the claim.
+            if self.provider_outage is not None:
+                self.provider_outage.set()
         finally:
             if claimed:
                 release_processing_tag(
@@ -115,26 +140,88 @@ class OcrProcessor(ErrorFinaliserMixin):
                     self.settings.OCR_PROCESSING_TAG_ID,
                     purpose="ocr",
                 )
-            self._log_ocr_stats()
-            elapsed = (dt.datetime.now() - start_time).total_seconds()
-            log.info(
-                "Finished processing document",
+            self._log_finished(start_time, success=success)
+
+    def _ocr_and_update(self, current_tags: set[int]) -> bool:
+        """
+        Download, OCR and assemble the document, then upload its text.
+
+        Returns ``True`` once the text has been written to Paperless. Every
+        other ending — an undecodable download, no pages, or unusable text
+        finalised with an error tag — returns ``False``, and :meth:`process`
+        makes sure the processing lock is released.
+
+        Raises:
+            OcrProviderUnavailableError: The vision provider is down.
+        """
+        converted = self._download_and_convert(current_tags)
+        if converted is None:
+            return False
+        pages, source = converted
+
+        # Each page worker closes its image as soon as the transcription
+        # returns. The stream itself is closed here, not left to garbage
+        # collection: a PDF's temp file and any pages rendered but not yet
+        # pulled go before the Paperless round trip, even when an outage
+        # aborts the document mid-stream.
+        try:
+            page_results, failed_pages = self._ocr_pages_in_parallel(
+                pages, source=source
+            )
+        finally:
+            self._close_page_stream(pages)
+        del pages, source, converted
+
+        if not page_results:
+            log.warning("Document has no pages to process", doc_id=self.doc_id)
+            return False
+
+        if failed_pages:
+            log.warning(
+                "OCR failed on some pages; marking document as error",
                 doc_id=self.doc_id,
-                elapsed_time=f"{elapsed:.2f}s",
-                success=success,
+                failed_pages=failed_pages,
             )
 
-    def _download_and_convert(self, current_tags: set[int]) -> list[Image.Image] | None:
+        full_text, models_used = assemble_full_text(
+            len(page_results),
+            page_results,
+            include_page_models=self.settings.OCR_INCLUDE_PAGE_MODELS,
+        )
+        if not self._check_usable_text(full_text):
+            return False
+        self._update_paperless_document(full_text, models_used)
+        return True
+
+    def _download_and_convert(
+        self, current_tags: set[int]
+    ) -> tuple[Iterable[Image.Image], SourceImage | None] | None:
         """
-        Download the document and rasterise it into page images.
+        Download the document and prepare its page images.
 
-        Returns the page images, or ``None`` when processing should stop: an
-        undecodable download finalises the document with an error tag, and a
-        document with no pages is logged and skipped.
+        A PDF comes back as a lazy page stream (see
+        :func:`~ocr.image_converter.iter_pdf_pages`); image formats are
+        decoded up front. Also returns the downloaded bytes when the document
+        is a single upright JPEG or PNG — as identified from the bytes — that
+        the provider can forward unchanged. Returns ``None`` when an
+        undecodable download has finalised the document with an error tag.
         """
         content, content_type = self.paperless_client.download_content(self.doc_id)
+        if is_pdf(content_type):
+            # Render PDF pages as wide as they will be OCR'd, capped at the
+            # CPU count: pdftoppm is CPU-bound. The cap is per document, so
+            # DOCUMENT_WORKERS documents rendering at once can still run up
+            # to DOCUMENT_WORKERS times as many processes.
+            thread_count = min(self.settings.PAGE_WORKERS, os.cpu_count() or 1)
+            pages = iter_pdf_pages(
+                content,
+                dpi=self.settings.OCR_DPI,
+                thread_count=thread_count,
+                max_side=self.settings.OCR_MAX_SIDE,
+            )
+            return pages, None
         try:
-            images = bytes_to_images(content, content_type, dpi=self.settings.OCR_DPI)
+            images = bytes_to_images(content, content_type)
         except ImageConversionError:
             log.exception(
                 "Unable to convert document to images; marking error",
@@ -143,55 +230,130 @@ class OcrProcessor(ErrorFinaliserMixin):
             self._finalise_with_error(current_tags)
             return None
 
-        if not images:
-            log.warning("Document has no pages to process", doc_id=self.doc_id)
-            return None
-        return images
+        if len(images) == 1:
+            media_type = forwardable_media_type(content)
+            if media_type is not None and media_type in PASSTHROUGH_CONTENT_TYPES:
+                return images, SourceImage(data=content, content_type=media_type)
+        return images, None
 
-    def _close_images(self, images: list[Image.Image]) -> None:
-        """Release every page image; a close failure is logged, never raised."""
-        for image in images:
-            try:
-                image.close()
-            except OSError:
-                log.warning("Failed to close image", doc_id=self.doc_id, exc_info=True)
+    def _close_page_stream(self, pages: Iterable[Image.Image]) -> None:
+        """Close a lazy page stream; a plain list of images has nothing to close."""
+        close = getattr(pages, "close", None)
+        if close is not None:
+            close()
+
+    def _close_image(self, image: Image.Image) -> None:
+        """Release one page image; a close failure is logged, never raised."""
+        try:
+            image.close()
+        except OSError:
+            log.warning("Failed to close image", doc_id=self.doc_id, exc_info=True)
+
+    def _transcribe_page(
+        self, image: Image.Image, page_num: int, source: SourceImage | None
+    ) -> PageResult:
+        """Transcribe one page image, then close it to free its pixel buffer.
+
+        The image is closed whether or not the transcription succeeds, so a
+        long document releases each page as it finishes instead of holding
+        every page until the slowest one returns.
+        """
+        try:
+            return self.ocr_provider.transcribe_image(
+                image, doc_id=self.doc_id, page_num=page_num, source=source
+            )
+        finally:
+            self._close_image(image)
 
     def _ocr_pages_in_parallel(
-        self, images: list[Image.Image]
+        self, pages: Iterable[Image.Image], *, source: SourceImage | None = None
     ) -> tuple[list[PageResult], list[int]]:
         """
         Run OCR on each page concurrently and preserve the original order.
 
+        *pages* is consumed only as workers free up — at most two pages per
+        worker are queued — so a streamed PDF is rendered just ahead of the
+        OCR rather than all at once. Takes ownership of every page it pulls:
+        each is closed by the time this returns. *source* is the original
+        file of a single-image document and is only ever passed alongside
+        exactly one page.
+
         Returns ``(page_results, failed_page_numbers)``.
+
+        Raises:
+            OcrProviderUnavailableError: The vision provider is down. Queued
+                pages are cancelled and no further pages are pulled, rather
+                than each waiting out its own retries against the same dead
+                endpoint.
         """
+        max_pending = 2 * self.settings.PAGE_WORKERS
+        results: list[PageResult] = []
+        failed_pages: list[int] = []
+        pending: dict[Future[PageResult], tuple[int, Image.Image]] = {}
         with ThreadPoolExecutor(max_workers=self.settings.PAGE_WORKERS) as executor:
-            future_to_index = {
-                executor.submit(
-                    self.ocr_provider.transcribe_image,
-                    img,
+            for index, image in enumerate(pages):
+                results.append(PageResult(text="", model=""))
+                future = executor.submit(
+                    self._transcribe_page, image, index + 1, source
+                )
+                pending[future] = (index, image)
+                if len(pending) >= max_pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    self._collect_pages(done, pending, results, failed_pages)
+            self._collect_pages(as_completed(pending), pending, results, failed_pages)
+        return results, failed_pages
+
+    def _collect_pages(
+        self,
+        futures: Iterable[Future[PageResult]],
+        pending: dict[Future[PageResult], tuple[int, Image.Image]],
+        results: list[PageResult],
+        failed_pages: list[int],
+    ) -> None:
+        """Record finished page futures into *results*, isolating failures."""
+        for future in futures:
+            index, _ = pending.pop(future)
+            try:
+                results[index] = future.result()
+            except OcrProviderUnavailableError:
+                # Every remaining page would fail the same way: stop
+                # dispatching and abort the document. process() catches this
+                # and releases the claim, so the document stays queued for
+                # the next poll.
+                cancelled = self._cancel_pending_pages(pending)
+                log.warning(
+                    "Vision provider unavailable; aborting document",
                     doc_id=self.doc_id,
-                    page_num=i + 1,
-                ): i
-                for i, img in enumerate(images)
-            }
-            results: list[PageResult] = [PageResult(text="", model="")] * len(images)
-            failed_pages: list[int] = []
-            for future in as_completed(future_to_index):
-                index = future_to_index[future]
-                try:
-                    results[index] = future.result()
-                except Exception:
-                    # rationale: per-page worker-dispatch boundary
-                    # (CODE_GUIDELINES §6.4, site 2) — one page's failure is
-                    # logged with its traceback and isolated as an error-marked
-                    # PageResult so the remaining pages still assemble.
-                    log.exception("OCR failed on page", page_num=index + 1)
-                    failed_pages.append(index + 1)
-                    results[index] = PageResult(
-                        text=f"{OCR_ERROR_MARKER} Failed to OCR page {index + 1}.",
-                        model="",
-                    )
-            return results, failed_pages
+                    page_num=index + 1,
+                    cancelled_pages=cancelled,
+                )
+                raise
+            except Exception:
+                # rationale: per-page worker-dispatch boundary
+                # (CODE_GUIDELINES §6.4, site 2) — one page's failure is
+                # logged with its traceback and isolated as an error-marked
+                # PageResult so the remaining pages still assemble.
+                log.exception("OCR failed on page", page_num=index + 1)
+                failed_pages.append(index + 1)
+                results[index] = PageResult(
+                    text=f"{OCR_ERROR_MARKER} Failed to OCR page {index + 1}.",
+                    model="",
+                )
+
+    def _cancel_pending_pages(
+        self, pending: dict[Future[PageResult], tuple[int, Image.Image]]
+    ) -> int:
+        """Cancel every queued page not yet started and close its image.
+
+        A cancelled page never reaches :meth:`_transcribe_page`, so its image
+        is closed here instead. Returns the number of pages cancelled.
+        """
+        cancelled = 0
+        for future, (_, image) in pending.items():
+            if future.cancel():
+                self._close_image(image)
+                cancelled += 1
+        return cancelled
 
     def _has_ocr_errors(self, text: str) -> bool:
         """Return True if the OCR output contains error/refusal/redacted markers."""
@@ -199,12 +361,14 @@ class OcrProcessor(ErrorFinaliserMixin):
             text, self.settings.OCR_REFUSAL_MARKERS
         )
 
-    def _update_paperless_document(self, full_text: str, models_used: set[str]) -> None:
+    def _check_usable_text(self, full_text: str) -> bool:
         """
-        Upload OCR text and update tags in Paperless.
+        Return ``True`` when *full_text* is fit to upload.
 
-        Detects error conditions (empty text, refusal markers, OCR errors)
-        and routes to :meth:`_finalise_with_error` instead of the happy path.
+        Error conditions (empty text, refusal markers, OCR errors) finalise
+        the document with an error tag and return ``False``, so the caller
+        stops before the happy-path update. ``False`` is a handled outcome —
+        the error has already been recorded — not a swallowed failure.
         """
         if not full_text.strip() or self._has_ocr_errors(full_text):
             reason = (
@@ -221,8 +385,11 @@ class OcrProcessor(ErrorFinaliserMixin):
                 ),
                 content=full_text,
             )
-            return
+            return False
+        return True
 
+    def _update_paperless_document(self, full_text: str, models_used: set[str]) -> None:
+        """Upload OCR text and swap the pipeline tags for the post tag."""
         current_tags = get_latest_tags(
             self.paperless_client, self.doc_id, fallback_doc=self.doc
         )
@@ -242,3 +409,14 @@ class OcrProcessor(ErrorFinaliserMixin):
         if not stats or not stats.get("attempts"):
             return
         log.info("OCR stats", doc_id=self.doc_id, **stats)
+
+    def _log_finished(self, start_time: dt.datetime, *, success: bool) -> None:
+        """Log the provider stats and the document's total processing time."""
+        self._log_ocr_stats()
+        elapsed = (dt.datetime.now() - start_time).total_seconds()
+        log.info(
+            "Finished processing document",
+            doc_id=self.doc_id,
+            elapsed_time=f"{elapsed:.2f}s",
+            success=success,
+        )
@@ -84,8 +84,8 @@ class TestOcrHappyPath:
 
         # The processing tag (500) should be absent from the final state.
         # Note: the happy path in _update_paperless_document already discards
-        # the processing tag before calling update_document, and then
-        # release_processing_tag in the finally block confirms it's gone.
+        # the processing tag before calling update_document, so process()
+        # skips release_processing_tag afterwards.
         assert 500 not in state["tags"]
         assert 500 not in tags  # also absent from the update_document call itself
 
@@ -108,7 +108,7 @@ class TestOcrHappyPath:
 
         call_count = [0]
 
-        def transcribe_side_effect(image, doc_id=None, page_num=None):
+        def transcribe_side_effect(image, doc_id=None, page_num=None, *, source=None):
             call_count[0] += 1
             return PageResult(f"Content of page {page_num}.", "gpt-5.4-mini")
 
@@ -92,8 +92,14 @@ def make_mock_paperless(**overrides: Any) -> MagicMock:
     - ``get_document`` returns ``make_document()``
     - ``download_content`` returns dummy PDF bytes
     - ``list_tags/correspondents/document_types`` return empty lists
+
+    The mock is specced on ``PaperlessClient``: calling a method the real
+    client does not have raises ``AttributeError`` instead of silently
+    returning another mock.
     """
-    mock = MagicMock()
+    from common.paperless import PaperlessClient
+
+    mock = MagicMock(spec=PaperlessClient)
     mock.settings = make_settings_obj()
 
     doc = make_document()
@@ -238,11 +244,13 @@ def make_mock_ocr_provider(**overrides: Any) -> MagicMock:
 
     ``transcribe_image`` returns a :class:`~ocr.text_assembly.PageResult` by
     default — the same shape the real provider yields, so the OCR worker and
-    the e2e workflow tests share one provider mock.
+    the e2e workflow tests share one provider mock. Specced on ``OcrProvider``
+    like :func:`make_mock_paperless`.
     """
+    from ocr.provider import OcrProvider
     from ocr.text_assembly import PageResult
 
-    mock = MagicMock()
+    mock = MagicMock(spec=OcrProvider)
     mock.transcribe_image.return_value = PageResult(
         "Transcribed text for page.", "gpt-5.4-mini"
     )
@@ -4,8 +4,9 @@ The SPA deep-link catch-all serves ``index.html`` for client-router paths
 such as ``/login`` and ``/setup`` so a hard refresh resolves.
 
 ``search.api`` resolves ``FRONTEND_DIST`` at *import* time, so the SPA tests
-set the env var, build the app in a child process-free way by reloading the
-module, and restore the environment afterwards.
+set the env var through ``monkeypatch``, build the app in a child
+process-free way by reloading the module, and reload it again once the
+environment is restored.
 
 Wave 3 note: the legacy SEARCH_API_KEY bearer tests are removed. The legacy
 bearer is retired as of Wave 3; programmatic access is by minted API keys.
@@ -14,9 +15,10 @@ bearer is retired as of Wave 3; programmatic access is by minted API keys.
 from __future__ import annotations
 
 import importlib
-import os
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
 from fastapi.testclient import TestClient
 from store.reader import StoreReader
 
@@ -53,12 +55,15 @@ def test_a_wrong_bearer_is_rejected_401(tmp_path: Path) -> None:
 # ---------------------------------------------------------------------------
 
 
-def _build_spa_client(tmp_path: Path) -> TestClient:
+@pytest.fixture
+def spa_client(tmp_path: Path) -> Iterator[TestClient]:
     """Build the real app with a populated ``web/dist`` set via FRONTEND_DIST.
 
     ``search.api`` reads ``FRONTEND_DIST`` at import time, so the env var is
-    set and the module reloaded before ``create_app`` is called. The caller
-    restores the environment in a ``finally`` block.
+    set and the module reloaded before ``create_app`` is called. The env
+    change is scoped to a private ``MonkeyPatch`` context, so teardown
+    restores only ``FRONTEND_DIST`` and then reloads again, leaving later
+    tests the module's default frontend path.
     """
     dist = tmp_path / "dist"
     dist.mkdir()
@@ -69,96 +74,68 @@ def _build_spa_client(tmp_path: Path) -> TestClient:
     assets.mkdir()
     (assets / "app-abcd1234.js").write_text("console.log('paperless-ai');")
 
-    os.environ["FRONTEND_DIST"] = str(dist)
     import search.api as search_api
 
-    importlib.reload(search_api)
-
-    settings = make_settings(tmp_path)
-    seed_store(settings)
-    # Migrate the app.db at settings.APP_DB_PATH so the app starts cleanly; the
-    # connection is closed at once — the app opens its own per request, and the
-    # SPA tests do not inspect app.db directly.
-    open_app_db(tmp_path).close()
-    store_reader = StoreReader(settings)
-    app = search_api.create_app(
-        settings,
-        core=make_mock_core(),
-        store_reader=store_reader,
-    )
-    return TestClient(app, raise_server_exceptions=False)
-
-
-def _restore_frontend_dist() -> None:
-    """Unset FRONTEND_DIST and reload ``search.api`` to its default state."""
-    os.environ.pop("FRONTEND_DIST", None)
-    import search.api as search_api
-
-    importlib.reload(search_api)
-
-
-def test_spa_serves_index_at_root(tmp_path: Path) -> None:
     try:
-        client = _build_spa_client(tmp_path)
-        response = client.get("/")
-        assert response.status_code == 200
-        assert "id=root" in response.text
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("FRONTEND_DIST", str(dist))
+            importlib.reload(search_api)
+            settings = make_settings(tmp_path)
+            seed_store(settings)
+            # Migrate the app.db at settings.APP_DB_PATH so the app starts
+            # cleanly; the connection is closed at once — the app opens its
+            # own per request, and the SPA tests do not inspect app.db
+            # directly.
+            open_app_db(tmp_path).close()
+            store_reader = StoreReader(settings)
+            app = search_api.create_app(
+                settings,
+                core=make_mock_core(),
+                store_reader=store_reader,
+            )
+            yield TestClient(app, raise_server_exceptions=False)
     finally:
-        _restore_frontend_dist()
+        importlib.reload(search_api)
+
 
+def test_spa_serves_index_at_root(spa_client: TestClient) -> None:
+    response = spa_client.get("/")
+    assert response.status_code == 200
+    assert "id=root" in response.text
 
-def test_spa_serves_index_for_a_login_deep_link(tmp_path: Path) -> None:
+
+def test_spa_serves_index_for_a_login_deep_link(spa_client: TestClient) -> None:
     """A hard refresh of /login serves index.html so React Router resolves it."""
-    try:
-        client = _build_spa_client(tmp_path)
-        response = client.get("/login")
-        assert response.status_code == 200
-        assert "id=root" in response.text
-    finally:
-        _restore_frontend_dist()
+    response = spa_client.get("/login")
+    assert response.status_code == 200
+    assert "id=root" in response.text
 
 
-def test_spa_serves_index_for_a_setup_deep_link(tmp_path: Path) -> None:
+def test_spa_serves_index_for_a_setup_deep_link(spa_client: TestClient) -> None:
     """A hard refresh of /setup serves index.html."""
-    try:
-        client = _build_spa_client(tmp_path)
-        response = client.get("/setup")
-        assert response.status_code == 200
-        assert "id=root" in response.text
-    finally:
-        _restore_frontend_dist()
+    response = spa_client.get("/setup")
+    assert response.status_code == 200
+    assert "id=root" in response.text
 
 
-def test_spa_serves_a_real_asset_as_itself(tmp_path: Path) -> None:
+def test_spa_serves_a_real_asset_as_itself(spa_client: TestClient) -> None:
     """A real built asset is served as itself, not replaced by index.html."""
-    try:
-        client = _build_spa_client(tmp_path)
-        response = client.get("/assets/app-abcd1234.js")
-        assert response.status_code == 200
-        assert "console.log" in response.text
-    finally:
-        _restore_frontend_dist()
+    response = spa_client.get("/assets/app-abcd1234.js")
+    assert response.status_code == 200
+    assert "console.log" in response.text
 
 
-def test_spa_does_not_swallow_an_api_route(tmp_path: Path) -> None:
+def test_spa_does_not_swallow_an_api_route(spa_client: TestClient) -> None:
     """An /api route still resolves to its handler, not to index.html."""
-    try:
-        client = _build_spa_client(tmp_path)
-        # The public setup-status route resolves to JSON, not the SPA shell.
-        response = client.get("/api/setup/status")
-        assert response.status_code == 200
-        assert "id=root" not in response.text
-        assert response.json() == {"needed": True}
-    finally:
-        _restore_frontend_dist()
+    # The public setup-status route resolves to JSON, not the SPA shell.
+    response = spa_client.get("/api/setup/status")
+    assert response.status_code == 200
+    assert "id=root" not in response.text
+    assert response.json() == {"needed": True}
 
 
-def test_spa_does_not_mask_an_unknown_api_path(tmp_path: Path) -> None:
+def test_spa_does_not_mask_an_unknown_api_path(spa_client: TestClient) -> None:
     """An unknown /api path 404s — it must not fall through to the SPA shell."""
-    try:
-        client = _build_spa_client(tmp_path)
-        response = client.get("/api/does-not-exist")
-        assert response.status_code == 404
-        assert "id=root" not in response.text
-    finally:
-        _restore_frontend_dist()
+    response = spa_client.get("/api/does-not-exist")
+    assert response.status_code == 404
+    assert "id=root" not in response.text
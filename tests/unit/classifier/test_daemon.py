@@ -129,7 +129,7 @@ class TestIterDocsSkipsAlreadyClassified:
 
         assert result == []
 
-    @patch("common.document_iter.remove_stale_queue_tag")
+    @patch("common.document_iter.remove_stale_queue_tags")
     def test_removes_stale_pre_tag(self, mock_remove):
         client = make_mock_paperless()
         settings = _settings(
@@ -144,8 +144,7 @@ class TestIterDocsSkipsAlreadyClassified:
 
         mock_remove.assert_called_once_with(
             client,
-            1,
-            {444, 555},
+            [1],
             pre_tag_id=444,
             processing_tag_id=666,
         )
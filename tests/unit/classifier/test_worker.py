@@ -302,14 +302,21 @@ class TestProcessLockRelease:
 
     @patch("classifier.worker.claim_processing_tag", return_value=True)
     @patch("classifier.worker.release_processing_tag")
-    def test_lock_released_on_success(self, mock_release, mock_claim):
+    def test_success_skips_release_as_metadata_write_drops_lock(
+        self, mock_release, mock_claim
+    ):
         doc = make_doc_with_content("text")
-        proc = make_processor(doc=doc)
+        proc = make_processor(
+            doc=doc, settings_overrides={"CLASSIFY_PROCESSING_TAG_ID": 777}
+        )
         proc.paperless_client.get_document.return_value = doc
 
         proc.process()
 
-        mock_release.assert_called_once()
+        # Assert — the lock went out with the metadata write, so no extra GET
+        mock_release.assert_not_called()
+        tags = proc.paperless_client.update_document_metadata.call_args[1]["tags"]
+        assert 777 not in tags
 
     @patch("classifier.worker.claim_processing_tag", return_value=True)
     @patch("classifier.worker.release_processing_tag")
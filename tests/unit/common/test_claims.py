@@ -46,6 +46,37 @@ class TestClaimProcessingTag:
         call_args = client.update_document_metadata.call_args
         assert tag_id in call_args.kwargs["tags"]
 
+    def test_prefetched_document_skips_the_pre_claim_refresh(self):
+        client = MagicMock()
+        client.get_document.return_value = {"tags": [10, 99]}  # verify only
+
+        result = claim_processing_tag(
+            client=client,
+            doc_id=42,
+            tag_id=99,
+            purpose="ocr",
+            latest={"tags": [10]},
+        )
+
+        assert result is True
+        client.get_document.assert_called_once_with(42)
+        assert client.update_document_metadata.call_args.kwargs["tags"] == {10, 99}
+
+    def test_prefetched_document_already_claimed(self):
+        client = MagicMock()
+
+        result = claim_processing_tag(
+            client=client,
+            doc_id=42,
+            tag_id=99,
+            purpose="ocr",
+            latest={"tags": [10, 99]},
+        )
+
+        assert result is False
+        client.get_document.assert_not_called()
+        client.update_document_metadata.assert_not_called()
+
     def test_returns_false_when_refresh_fails(self):
         client = MagicMock()
         client.get_document.side_effect = ConnectionError("unreachable")
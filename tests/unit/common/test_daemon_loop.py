@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from unittest.mock import MagicMock, patch
 
 from common.daemon_loop import _safe_item_summary, run_polling_threadpool
@@ -205,6 +206,27 @@ class TestRunPollingThreadpool:
 
         process_item.assert_called_once()
 
+    def test_worker_threads_are_reused_across_polls(self):
+        fetch_work = MagicMock(return_value=[{"id": 1}])
+        seen_threads: list[threading.Thread] = []
+
+        def process_item(item):
+            seen_threads.append(threading.current_thread())
+
+        with patch(f"{MODULE}.is_shutdown_requested", _make_shutdown_after(3)):
+            run_polling_threadpool(
+                daemon_name="test",
+                fetch_work=fetch_work,
+                process_item=process_item,
+                poll_interval_seconds=5,
+                max_workers=1,
+                sleep=_make_sleep_noop(),
+            )
+
+        # Assert — three polls, one pool: the single worker served them all
+        assert len(seen_threads) == 3
+        assert len(set(seen_threads)) == 1
+
     def test_stops_on_shutdown_signal(self):
         fetch_work = MagicMock(return_value=[{"id": 1}])
         process_item = MagicMock()
@@ -98,11 +98,17 @@ class TestSkipsProcessedDocs:
 
         assert result == []
 
-    @patch("common.document_iter.remove_stale_queue_tag")
-    def test_removes_stale_pre_tag(self, mock_remove):
-        client = _make_mock_client([{"id": 1, "tags": [443, 444]}])
+    @patch("common.document_iter.remove_stale_queue_tags")
+    def test_removes_stale_pre_tags_in_one_batch(self, mock_remove):
+        client = _make_mock_client(
+            [
+                {"id": 1, "tags": [443, 444]},
+                {"id": 2, "tags": [443]},
+                {"id": 3, "tags": [443, 444]},
+            ]
+        )
 
-        list(
+        result = list(
             iter_documents_by_pipeline_tag(
                 client,
                 pre_tag_id=443,
@@ -112,7 +118,10 @@ class TestSkipsProcessedDocs:
             )
         )
 
-        mock_remove.assert_called_once()
+        assert [doc["id"] for doc in result] == [2]
+        mock_remove.assert_called_once_with(
+            client, [1, 3], pre_tag_id=443, processing_tag_id=999
+        )
 
 
 class TestSkipsClaimedDocs:
@@ -20,6 +20,9 @@ def _make_settings(
     s.LLM_PROVIDER = provider
     s.OPENAI_API_KEY = api_key
     s.OLLAMA_BASE_URL = base_url
+    s.DOCUMENT_WORKERS = 4
+    s.PAGE_WORKERS = 8
+    s.LLM_MAX_CONCURRENT = 0
     return s
 
 
@@ -101,7 +104,9 @@ class TestHttpxClientAndCleanup:
         mock_client_cls.return_value = mock_http
         settings = _make_settings()
         setup_libraries(settings)
-        mock_client_cls.assert_called_once_with(trust_env=False)
+        mock_client_cls.assert_called_once_with(
+            trust_env=False, limits=library_setup._llm_pool_limits(settings)
+        )
         assert mock_openai_cls.call_args.kwargs["http_client"] is mock_http
         # The atexit callback is the module's _close_active_http_client
         # function (NOT the client's .close directly) — so it always closes
@@ -158,3 +163,31 @@ class TestHttpxClientAndCleanup:
         callback = mock_register.call_args.args[0]
         callback()
         second_http.close.assert_called_once()
+
+
+class TestLlmPoolLimits:
+    def test_keepalive_covers_document_times_page_workers(self):
+        settings = _make_settings()
+
+        limits = library_setup._llm_pool_limits(settings)
+
+        assert limits.max_keepalive_connections == 32
+        assert limits.max_connections == 100
+
+    def test_global_llm_cap_lowers_the_peak(self):
+        settings = _make_settings()
+        settings.LLM_MAX_CONCURRENT = 6
+
+        limits = library_setup._llm_pool_limits(settings)
+
+        assert limits.max_keepalive_connections == 6
+
+    def test_max_connections_grows_past_httpx_default(self):
+        settings = _make_settings()
+        settings.DOCUMENT_WORKERS = 10
+        settings.PAGE_WORKERS = 20
+
+        limits = library_setup._llm_pool_limits(settings)
+
+        assert limits.max_keepalive_connections == 200
+        assert limits.max_connections == 200
@@ -278,6 +278,38 @@ class TestUpdateDocument:
         assert b"new content" in body
         client.close()
 
+    def test_tags_are_sent_sorted(self):
+        with respx.mock:
+            route = respx.patch(f"{BASE}/api/documents/1/").mock(
+                return_value=httpx.Response(200, json={}),
+            )
+            client = _make_client()
+
+            client.update_document(1, "content", {30, 2, 10})
+
+        body = json_mod.loads(route.calls[0].request.content)
+        assert body["tags"] == [2, 10, 30]
+        client.close()
+
+
+class TestBulkRemoveTags:
+    def test_posts_one_modify_tags_bulk_edit(self):
+        with respx.mock:
+            route = respx.post(f"{BASE}/api/documents/bulk_edit/").mock(
+                return_value=httpx.Response(200, json={"result": "OK"}),
+            )
+            client = _make_client()
+
+            client.bulk_remove_tags([3, 1], {20, 10})
+
+        body = json_mod.loads(route.calls[0].request.content)
+        assert body == {
+            "documents": [1, 3],
+            "method": "modify_tags",
+            "parameters": {"add_tags": [], "remove_tags": [10, 20]},
+        }
+        client.close()
+
 
 class TestUpdateDocumentMetadata:
     def test_sends_only_non_none_fields(self):
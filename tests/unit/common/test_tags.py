@@ -9,7 +9,7 @@ from common.tags import (
     extract_tags,
     get_latest_tags,
     release_processing_tag,
-    remove_stale_queue_tag,
+    remove_stale_queue_tags,
 )
 from tests.helpers.factories import make_settings_obj
 
@@ -98,54 +98,37 @@ class TestGetLatestTags:
         assert result == set()
 
 
-class TestRemoveStaleQueueTag:
-    """Tests for remove_stale_queue_tag()."""
+class TestRemoveStaleQueueTags:
+    """Tests for remove_stale_queue_tags()."""
 
-    def test_removes_pre_tag_id_from_tags_and_updates(self):
+    def test_removes_pre_tag_from_every_document_in_one_call(self):
         client = MagicMock()
-        tags = {10, 20, 30}
-        pre_tag_id = 10
 
-        remove_stale_queue_tag(client, doc_id=1, tags=tags, pre_tag_id=pre_tag_id)
+        remove_stale_queue_tags(client, [1, 2, 3], pre_tag_id=10)
 
-        call_args = client.update_document_metadata.call_args
-        assert pre_tag_id not in call_args.kwargs["tags"]
+        client.bulk_remove_tags.assert_called_once_with([1, 2, 3], {10})
 
     def test_also_removes_processing_tag_id_when_provided(self):
         client = MagicMock()
-        tags = {10, 20, 30}
-
-        remove_stale_queue_tag(
-            client,
-            doc_id=1,
-            tags=tags,
-            pre_tag_id=10,
-            processing_tag_id=20,
-        )
 
-        call_args = client.update_document_metadata.call_args
-        updated_tags = set(call_args.kwargs["tags"])
-        assert 10 not in updated_tags
-        assert 20 not in updated_tags
-        assert 30 in updated_tags
+        remove_stale_queue_tags(client, [1], pre_tag_id=10, processing_tag_id=20)
+
+        client.bulk_remove_tags.assert_called_once_with([1], {10, 20})
 
     def test_handles_api_error_gracefully(self):
         client = MagicMock()
-        client.update_document_metadata.side_effect = ConnectionError("API error")
-        tags = {10, 20}
+        client.bulk_remove_tags.side_effect = ConnectionError("API error")
 
-        remove_stale_queue_tag(client, doc_id=1, tags=tags, pre_tag_id=10)
+        remove_stale_queue_tags(client, [1], pre_tag_id=10)
 
-        client.update_document_metadata.assert_called_once()
+        client.bulk_remove_tags.assert_called_once()
 
-    def test_does_not_mutate_original_tags_set(self):
+    def test_no_documents_makes_no_call(self):
         client = MagicMock()
-        original_tags = {10, 20, 30}
-        tags_copy = set(original_tags)
 
-        remove_stale_queue_tag(client, doc_id=1, tags=original_tags, pre_tag_id=10)
+        remove_stale_queue_tags(client, [], pre_tag_id=10)
 
-        assert original_tags == tags_copy
+        client.bulk_remove_tags.assert_not_called()
 
 
 class TestReleaseProcessingTag:
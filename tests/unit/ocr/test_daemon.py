@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import os
+import threading
 import unittest.mock
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from ocr.daemon import (
+    _before_poll,
     _DaemonState,
     _iter_docs_to_ocr,
     _process_document,
@@ -151,7 +153,8 @@ class TestMain:
         assert captured_process is not None
         doc = _doc(1, tags=[443])
         captured_process(doc)
-        mock_process.assert_called_once_with(doc, settings)
+        mock_process.assert_called_once_with(doc, settings, unittest.mock.ANY)
+        assert isinstance(mock_process.call_args.args[2], threading.Event)
 
     @patch("ocr.daemon.ensure_schema")
     @patch("ocr.daemon.connect_app_db")
@@ -237,7 +240,7 @@ class TestIterDocsToOcrSkipsNonIntegerId:
 
 
 class TestIterDocsToOcrSkipsPostTagged:
-    @patch("common.document_iter.remove_stale_queue_tag")
+    @patch("common.document_iter.remove_stale_queue_tags")
     def test_skips_doc_with_post_tag_and_removes_stale_pre(self, mock_remove):
         settings = _settings(
             PRE_TAG_ID=443,
@@ -253,15 +256,14 @@ class TestIterDocsToOcrSkipsPostTagged:
         assert result == []
         mock_remove.assert_called_once_with(
             list_client,
-            1,
-            {443, 444},
+            [1],
             pre_tag_id=443,
             processing_tag_id=999,
         )
 
-    @patch("common.document_iter.remove_stale_queue_tag")
+    @patch("common.document_iter.remove_stale_queue_tags")
     def test_skips_doc_with_post_tag_without_pre_tag(self, mock_remove):
-        # Arrange — has post tag but not pre tag (shouldn't call remove)
+        # Arrange — has post tag but not pre tag (nothing to remove)
         settings = _settings(
             PRE_TAG_ID=443,
             POST_TAG_ID=444,
@@ -274,7 +276,7 @@ class TestIterDocsToOcrSkipsPostTagged:
         result = list(_iter_docs_to_ocr(list_client, settings))
 
         assert result == []
-        mock_remove.assert_not_called()
+        assert mock_remove.call_args.args[1] == []
 
 
 class TestIterDocsToOcrSkipsClaimed:
@@ -309,7 +311,7 @@ class TestIterDocsToOcrSkipsClaimed:
 
 
 class TestIterDocsToOcrMixed:
-    @patch("common.document_iter.remove_stale_queue_tag")
+    @patch("common.document_iter.remove_stale_queue_tags")
     def test_mixed_bag_of_documents(self, mock_remove):
         settings = _settings(
             PRE_TAG_ID=443,
@@ -356,7 +358,11 @@ class TestProcessDocument:
         MockClient.assert_called_once_with(settings)
         MockProvider.assert_called_once_with(settings)
         MockProcessor.assert_called_once_with(
-            doc, mock_client_instance, mock_provider_instance, settings
+            doc,
+            mock_client_instance,
+            mock_provider_instance,
+            settings,
+            provider_outage=None,
         )
         mock_processor_instance.process.assert_called_once()
         mock_client_instance.close.assert_called_once()
@@ -397,6 +403,32 @@ class TestProcessDocument:
 
         MockProvider.assert_called_once_with(settings)
 
+    @patch("ocr.daemon.OcrProvider")
+    @patch("common.per_document.PaperlessClient")
+    @patch("ocr.daemon.OcrProcessor")
+    def test_outage_flag_passed_to_processor(
+        self, MockProcessor, MockClient, MockProvider
+    ):
+        outage = threading.Event()
+
+        _process_document(_doc(1, tags=[443]), _settings(), outage)
+
+        assert MockProcessor.call_args.kwargs["provider_outage"] is outage
+
+
+@patch("ocr.daemon._reload_if_changed")
+def test_before_poll_clears_outage_then_reloads(mock_reload) -> None:
+    state = _DaemonState(
+        settings=_settings(), list_client=make_mock_paperless(), app_db_path="x"
+    )
+    state.provider_outage.set()
+
+    _before_poll(state)
+
+    # Assert — each poll retries the provider afresh
+    assert not state.provider_outage.is_set()
+    mock_reload.assert_called_once_with(state)
+
 
 class _FakeListClient:
     """Stub for the daemon's list_client whose close() is a no-op."""
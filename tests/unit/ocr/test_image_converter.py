@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import math
+import os
 from io import BytesIO
 from unittest.mock import MagicMock, patch
 
 import pytest
-from PIL import Image
+from PIL import ExifTags, Image
 
-from ocr.image_converter import ImageConversionError, bytes_to_images
+from ocr.image_converter import (
+    ImageConversionError,
+    bytes_to_images,
+    forwardable_media_type,
+    is_pdf,
+    iter_pdf_pages,
+)
 
 
 def _make_png_bytes(width: int = 10, height: int = 10) -> bytes:
@@ -92,43 +100,244 @@ class TestBytesToImagesTiff:
 
 
 class TestBytesToImagesPdf:
-    @patch("ocr.image_converter.convert_from_bytes")
-    def test_pdf_delegates_to_convert_from_bytes(self, mock_convert):
-        mock_images = [MagicMock(spec=Image.Image), MagicMock(spec=Image.Image)]
-        mock_convert.return_value = mock_images
-        pdf_bytes = b"%PDF-1.4 fake content"
+    @pytest.mark.parametrize(
+        "content_type",
+        ["application/pdf", "Application/PDF", "application/pdf; charset=utf-8"],
+    )
+    def test_pdf_rejected_in_favour_of_iter_pdf_pages(self, content_type):
+        with pytest.raises(ValueError, match="iter_pdf_pages"):
+            bytes_to_images(b"%PDF-1.4 fake", content_type)
+
+
+def _render_pages(pdf_path, *, first_page, last_page, **kwargs):
+    """Stand-in for ``convert_from_path``: one mock image per page."""
+    return [MagicMock(spec=Image.Image) for _ in range(first_page, last_page + 1)]
+
+
+class TestIterPdfPages:
+    @patch("ocr.image_converter.convert_from_path", side_effect=_render_pages)
+    @patch("ocr.image_converter.pdfinfo_from_path", return_value={"Pages": 23})
+    def test_renders_in_chunks(self, mock_info, mock_convert):
+        pages = list(iter_pdf_pages(b"%PDF", dpi=150, thread_count=2, chunk_pages=10))
+
+        assert len(pages) == 23
+        ranges = [
+            (c.kwargs["first_page"], c.kwargs["last_page"])
+            for c in mock_convert.call_args_list
+        ]
+        assert ranges == [(1, 10), (11, 20), (21, 23)]
+        assert mock_convert.call_args.kwargs["dpi"] == 150
+        assert mock_convert.call_args.kwargs["thread_count"] == 2
+
+    @patch("ocr.image_converter.convert_from_path", side_effect=_render_pages)
+    @patch("ocr.image_converter.pdfinfo_from_path", return_value={"Pages": 23})
+    def test_pdf_written_once_and_removed_when_exhausted(self, mock_info, mock_convert):
+        written: list[bytes] = []
+
+        def render(pdf_path, **kwargs):
+            with open(pdf_path, "rb") as pdf_file:
+                written.append(pdf_file.read())
+            return _render_pages(pdf_path, **kwargs)
+
+        mock_convert.side_effect = render
+
+        list(iter_pdf_pages(b"%PDF-bytes", chunk_pages=10))
+
+        # Assert — every chunk renders from the same file, probed once
+        paths = {c.args[0] for c in mock_convert.call_args_list}
+        assert len(paths) == 1
+        assert written == [b"%PDF-bytes"] * 3
+        mock_info.assert_called_once_with(paths.pop())
+        assert not os.path.exists(mock_info.call_args.args[0])
+
+    @patch("ocr.image_converter.convert_from_path", side_effect=_render_pages)
+    @patch("ocr.image_converter.pdfinfo_from_path", return_value={"Pages": 30})
+    def test_pdf_removed_when_closed_early(self, mock_info, mock_convert):
+        pages = iter_pdf_pages(b"%PDF", chunk_pages=10)
+        next(pages)
+
+        pages.close()
+
+        assert not os.path.exists(mock_info.call_args.args[0])
+
+    @patch("ocr.image_converter.convert_from_path")
+    @patch("ocr.image_converter.pdfinfo_from_path", return_value={"Pages": 30})
+    def test_unread_pages_of_chunk_closed_when_closed_early(
+        self, mock_info, mock_convert
+    ):
+        chunk = _render_pages("", first_page=1, last_page=10)
+        mock_convert.return_value = chunk
+        pages = iter_pdf_pages(b"%PDF", chunk_pages=10)
+        next(pages)
+        next(pages)
+
+        pages.close()
+
+        # Assert — the two pages handed out belong to the caller
+        for image in chunk[:2]:
+            image.close.assert_not_called()
+        for image in chunk[2:]:
+            image.close.assert_called_once()
+
+    @patch("ocr.image_converter.convert_from_path", side_effect=_render_pages)
+    @patch("ocr.image_converter.pdfinfo_from_path", return_value={"Pages": 30})
+    def test_next_chunk_rendered_only_when_consumed(self, mock_info, mock_convert):
+        pages = iter_pdf_pages(b"%PDF", chunk_pages=10)
+
+        # Assert — the page count is read eagerly, pixels lazily
+        mock_info.assert_called_once()
+        mock_convert.assert_not_called()
+        for _ in range(10):
+            next(pages)
+        assert mock_convert.call_count == 1
+
+    @patch("ocr.image_converter.pdfinfo_from_path", side_effect=RuntimeError("bad"))
+    def test_unreadable_pdf_fails_eagerly(self, mock_info):
+        with pytest.raises(RuntimeError):
+            iter_pdf_pages(b"not a pdf")
+
+        assert not os.path.exists(mock_info.call_args.args[0])
+
+
+class TestIterPdfPagesFitDpi:
+    @staticmethod
+    def _pdfinfo(sizes: dict[int, str]):
+        def pdfinfo(pdf_path, *, first_page=None, last_page=None):
+            info = {"Pages": len(sizes)}
+            if first_page is not None:
+                # Like pdfinfo, clamp -l to the last page
+                for page in range(first_page, min(last_page, len(sizes)) + 1):
+                    info[f"Page {page:4d} size"] = sizes[page]
+                    info[f"Page {page:4d} rot"] = "0"
+            return info
+
+        return pdfinfo
+
+    @patch("ocr.image_converter.convert_from_path", return_value=[])
+    @patch("ocr.image_converter.pdfinfo_from_path")
+    def test_a4_rendered_at_max_side_not_full_dpi(self, mock_info, mock_convert):
+        mock_info.side_effect = self._pdfinfo({1: "595.276 x 841.89 pts (A4)"})
+
+        list(iter_pdf_pages(b"%PDF", dpi=300, max_side=1600))
+
+        # Assert — 1600 px over 11.69 in: 136 DPI, not 300
+        assert mock_convert.call_args.kwargs["dpi"] == 136
+
+    @pytest.mark.parametrize(
+        "size",
+        [
+            pytest.param("595.276 x 841.89 pts (A4)", id="a4"),
+            pytest.param("612 x 792 pts (letter)", id="letter"),
+            pytest.param("612 x 1008 pts (legal)", id="legal"),
+            pytest.param("841.89 x 1190.55 pts (A3)", id="a3"),
+        ],
+    )
+    @patch("ocr.image_converter.convert_from_path", return_value=[])
+    @patch("ocr.image_converter.pdfinfo_from_path")
+    def test_rendered_page_fits_max_side(self, mock_info, mock_convert, size):
+        mock_info.side_effect = self._pdfinfo({1: size})
+
+        list(iter_pdf_pages(b"%PDF", dpi=300, max_side=1600))
+
+        # Assert — pdftoppm's pixel size, ceil(points x DPI / 72), stays
+        # within the limit, so the provider has nothing left to resize
+        dpi = mock_convert.call_args.kwargs["dpi"]
+        long_side = max(float(side) for side in size.split(" pts")[0].split(" x "))
+        assert math.ceil(long_side * dpi / 72) <= 1600
+
+    @patch("ocr.image_converter.convert_from_path", return_value=[])
+    @patch("ocr.image_converter.pdfinfo_from_path")
+    def test_small_page_capped_at_configured_dpi(self, mock_info, mock_convert):
+        mock_info.side_effect = self._pdfinfo({1: "144 x 216 pts"})
+
+        list(iter_pdf_pages(b"%PDF", dpi=300, max_side=1600))
+
+        assert mock_convert.call_args.kwargs["dpi"] == 300
 
-        result = bytes_to_images(pdf_bytes, "application/pdf")
+    @patch("ocr.image_converter.convert_from_path", return_value=[])
+    @patch("ocr.image_converter.pdfinfo_from_path")
+    def test_mixed_chunk_sized_on_smallest_page(self, mock_info, mock_convert):
+        mock_info.side_effect = self._pdfinfo(
+            {1: "595.276 x 841.89 pts (A4)", 2: "288 x 576 pts"}
+        )
 
-        mock_convert.assert_called_once_with(pdf_bytes, dpi=300)
-        assert result == mock_images
+        list(iter_pdf_pages(b"%PDF", dpi=300, max_side=1600))
 
-    @patch("ocr.image_converter.convert_from_bytes")
-    def test_pdf_custom_dpi(self, mock_convert):
-        mock_convert.return_value = [MagicMock(spec=Image.Image)]
-        pdf_bytes = b"%PDF-1.4 fake"
+        # Assert — the 8 in page needs 200 DPI; the A4 page is downsized later
+        assert mock_convert.call_args.kwargs["dpi"] == 200
 
-        bytes_to_images(pdf_bytes, "application/pdf", dpi=150)
+    @patch("ocr.image_converter.convert_from_path", return_value=[])
+    @patch("ocr.image_converter.pdfinfo_from_path")
+    def test_page_sizes_read_once_for_every_chunk(self, mock_info, mock_convert):
+        sizes = {page: "595.276 x 841.89 pts (A4)" for page in range(1, 24)}
+        sizes[21] = "288 x 576 pts"
+        mock_info.side_effect = self._pdfinfo(sizes)
 
-        mock_convert.assert_called_once_with(pdf_bytes, dpi=150)
+        list(iter_pdf_pages(b"%PDF", dpi=300, chunk_pages=10, max_side=1600))
 
-    @patch("ocr.image_converter.convert_from_bytes")
-    def test_pdf_content_type_case_insensitive(self, mock_convert):
-        mock_convert.return_value = []
+        # Assert — one ranged probe gives the count and sizes for every chunk
+        mock_info.assert_called_once()
+        assert mock_info.call_args.kwargs["first_page"] == 1
+        assert mock_info.call_args.kwargs["last_page"] >= 23
+        dpis = [c.kwargs["dpi"] for c in mock_convert.call_args_list]
+        assert dpis == [136, 136, 200]
 
-        bytes_to_images(b"fake", "Application/PDF")
+    @patch("ocr.image_converter.convert_from_path", return_value=[])
+    @patch("ocr.image_converter.pdfinfo_from_path")
+    def test_tiny_max_side_never_renders_at_zero_dpi(self, mock_info, mock_convert):
+        mock_info.side_effect = self._pdfinfo({1: "595.276 x 841.89 pts (A4)"})
 
-        mock_convert.assert_called_once()
+        list(iter_pdf_pages(b"%PDF", dpi=300, max_side=1))
 
-    @patch("ocr.image_converter.convert_from_bytes")
-    def test_pdf_content_type_with_charset(self, mock_convert):
-        # Arrange — content type might include extra params
-        mock_convert.return_value = []
+        assert mock_convert.call_args.kwargs["dpi"] == 1
 
-        bytes_to_images(b"fake", "application/pdf; charset=utf-8")
+    @patch("ocr.image_converter.convert_from_path", return_value=[])
+    @patch("ocr.image_converter.pdfinfo_from_path")
+    def test_unreadable_sizes_fall_back_to_dpi(self, mock_info, mock_convert):
+        mock_info.return_value = {"Pages": 1}
+
+        list(iter_pdf_pages(b"%PDF", dpi=300, max_side=1600))
+
+        assert mock_convert.call_args.kwargs["dpi"] == 300
+
+
+def _make_rotated_jpeg_bytes() -> bytes:
+    """Create JPEG bytes tagged with EXIF orientation 6 (rotate 90° CW)."""
+    exif = Image.Exif()
+    exif[ExifTags.Base.Orientation] = 6
+    buf = BytesIO()
+    Image.new("RGB", (10, 10), color="blue").save(buf, format="JPEG", exif=exif)
+    return buf.getvalue()
 
-        # Assert — still detected as PDF because "pdf" is in the string
-        mock_convert.assert_called_once()
+
+class TestForwardableMediaType:
+    def test_jpeg(self):
+        assert forwardable_media_type(_make_jpeg_bytes()) == "image/jpeg"
+
+    def test_png(self):
+        assert forwardable_media_type(_make_png_bytes()) == "image/png"
+
+    def test_type_read_from_the_bytes_not_the_label(self):
+        # Assert — TIFF bytes report as TIFF whatever Paperless called them
+        assert forwardable_media_type(_make_tiff_bytes()) == "image/tiff"
+
+    def test_rotated_jpeg_not_forwarded(self):
+        assert forwardable_media_type(_make_rotated_jpeg_bytes()) is None
+
+    def test_unidentifiable_bytes_not_forwarded(self):
+        assert forwardable_media_type(b"not an image") is None
+
+
+class TestIsPdf:
+    @pytest.mark.parametrize(
+        "content_type",
+        ["application/pdf", "Application/PDF", "application/pdf; charset=utf-8"],
+    )
+    def test_pdf_types(self, content_type):
+        assert is_pdf(content_type) is True
+
+    def test_image_type(self):
+        assert is_pdf("image/png") is False
 
 
 class TestBytesToImagesInvalid:
@@ -166,14 +375,6 @@ class TestBytesToImagesUnknownType:
 
 
 class TestContentTypeMatching:
-    @patch("ocr.image_converter.convert_from_bytes")
-    def test_application_pdf_routes_to_pdf2image(self, mock_convert):
-        mock_convert.return_value = []
-
-        bytes_to_images(b"pdf-data", "application/pdf")
-
-        mock_convert.assert_called_once()
-
     def test_image_png_routes_to_pillow(self):
         png_bytes = _make_png_bytes()
 
@@ -5,11 +5,13 @@ from __future__ import annotations
 import threading
 from unittest.mock import MagicMock, patch
 
+import httpx
 import openai
+import pytest
 from PIL import Image
 
 from common.content_checks import is_error_content
-from ocr.provider import OcrProvider
+from ocr.provider import OcrProvider, OcrProviderUnavailableError
 
 
 def _make_settings(**overrides):
@@ -257,63 +259,53 @@ class TestOcrProviderAllFail:
         assert page.model == ""
 
 
-class TestOcrProviderBlankImage:
-    @patch("ocr.provider.is_blank", return_value=True)
-    def test_blank_image_returns_empty_without_api_call(self, mock_is_blank):
-        settings = _make_settings(AI_MODELS=["model-a"])
+class TestOcrProviderOutage:
+    def test_authentication_error_raises_without_fallback(self):
+        settings = _make_settings(AI_MODELS=["model-a", "model-b"])
         provider = OcrProvider(settings)
-        provider._create_completion = MagicMock()
-        image = _make_blank_image()
+        request = httpx.Request("POST", "http://llm.test/v1/chat/completions")
+        provider._create_completion = MagicMock(
+            side_effect=openai.AuthenticationError(
+                message="bad key",
+                response=httpx.Response(401, request=request),
+                body=None,
+            )
+        )
 
-        page = provider.transcribe_image(image, doc_id=1, page_num=1)
+        with pytest.raises(OcrProviderUnavailableError):
+            provider.transcribe_image(_make_test_image())
 
-        assert page.text == ""
-        assert page.model == ""
-        provider._create_completion.assert_not_called()
+        # Assert — model-b is never tried; the key is shared by every model
+        provider._create_completion.assert_called_once()
+        assert provider.get_stats()["api_errors"] == 1
 
-    @patch("ocr.provider.is_blank", return_value=True)
-    def test_blank_image_no_stats_increment(self, mock_is_blank):
-        settings = _make_settings(AI_MODELS=["model-a"])
+    def test_connection_error_raises_without_fallback(self):
+        settings = _make_settings(AI_MODELS=["model-a", "model-b"])
         provider = OcrProvider(settings)
-        provider._create_completion = MagicMock()
-        image = _make_blank_image()
-
-        provider.transcribe_image(image)
-
-        stats = provider.get_stats()
-        assert stats["attempts"] == 0
-
-
-class TestOcrProviderImageResize:
-    @patch("ocr.provider.is_blank", return_value=False)
-    def test_large_image_resized(self, mock_is_blank):
-        settings = _make_settings(
-            AI_MODELS=["model-a"],
-            OCR_MAX_SIDE=500,
+        request = httpx.Request("POST", "http://llm.test/v1/chat/completions")
+        provider._create_completion = MagicMock(
+            side_effect=openai.APIConnectionError(request=request)
         )
-        provider = OcrProvider(settings)
-        provider._create_completion = MagicMock(return_value=_make_response("text"))
-        # Create image larger than OCR_MAX_SIDE
-        image = _make_test_image(width=1000, height=800)
 
-        provider.transcribe_image(image)
+        with pytest.raises(OcrProviderUnavailableError):
+            provider.transcribe_image(_make_test_image())
 
-        # Assert — the caller's image must NOT be mutated (copy is made internally)
-        assert image.size == (1000, 800)
+        provider._create_completion.assert_called_once()
 
-    @patch("ocr.provider.is_blank", return_value=False)
-    def test_small_image_not_resized(self, mock_is_blank):
-        settings = _make_settings(
-            AI_MODELS=["model-a"],
-            OCR_MAX_SIDE=2000,
-        )
+    def test_timeout_still_falls_back_to_next_model(self):
+        settings = _make_settings(AI_MODELS=["model-a", "model-b"])
         provider = OcrProvider(settings)
-        provider._create_completion = MagicMock(return_value=_make_response("text"))
-        image = _make_test_image(width=100, height=100)
+        request = httpx.Request("POST", "http://llm.test/v1/chat/completions")
+        provider._create_completion = MagicMock(
+            side_effect=[
+                openai.APITimeoutError(request=request),
+                _make_response("Fallback transcription"),
+            ]
+        )
 
-        provider.transcribe_image(image)
+        page = provider.transcribe_image(_make_test_image())
 
-        assert image.size == (100, 100)
+        assert page.model == "model-b"
 
 
 class TestOcrProviderStats:
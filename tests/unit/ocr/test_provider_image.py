@@ -0,0 +1,150 @@
+"""Tests for ocr.provider — preparing the page image sent to the model.
+
+Covers blank-page skipping, resizing to ``OCR_MAX_SIDE``, and forwarding a
+single-image document's original bytes. Split from ``test_provider`` (the
+model fallback chain) for the 500-line ceiling (CODE_GUIDELINES §3.1).
+"""
+
+from __future__ import annotations
+
+import base64
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+from PIL import Image
+
+from ocr.provider import OcrProvider, SourceImage
+from tests.helpers.factories import make_settings_obj
+
+
+def _make_settings(**overrides):
+    return make_settings_obj(**overrides)
+
+
+def _make_response(text: str) -> MagicMock:
+    """Create a mock OpenAI chat completion response."""
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = text
+    return response
+
+
+def _make_test_image(width: int = 100, height: int = 100) -> Image.Image:
+    """Create a non-blank test image."""
+    return Image.new("RGB", (width, height), color="red")
+
+
+def _make_blank_image() -> Image.Image:
+    """Create a blank (all-white) image."""
+    return Image.new("RGB", (100, 100), color="white")
+
+
+def _sent_image_url(provider: OcrProvider) -> str:
+    """Return the data URL of the image sent in the last completion call."""
+    messages = provider._create_completion.call_args.kwargs["messages"]
+    return messages[1]["content"][0]["image_url"]["url"]
+
+
+class TestOcrProviderBlankImage:
+    @patch("ocr.provider.is_blank", return_value=True)
+    def test_blank_image_returns_empty_without_api_call(self, mock_is_blank):
+        settings = _make_settings(AI_MODELS=["model-a"])
+        provider = OcrProvider(settings)
+        provider._create_completion = MagicMock()
+        image = _make_blank_image()
+
+        page = provider.transcribe_image(image, doc_id=1, page_num=1)
+
+        assert page.text == ""
+        assert page.model == ""
+        provider._create_completion.assert_not_called()
+
+    @patch("ocr.provider.is_blank", return_value=True)
+    def test_blank_image_no_stats_increment(self, mock_is_blank):
+        settings = _make_settings(AI_MODELS=["model-a"])
+        provider = OcrProvider(settings)
+        provider._create_completion = MagicMock()
+        image = _make_blank_image()
+
+        provider.transcribe_image(image)
+
+        stats = provider.get_stats()
+        assert stats["attempts"] == 0
+
+
+class TestOcrProviderImageResize:
+    @patch("ocr.provider.is_blank", return_value=False)
+    def test_large_image_resized(self, mock_is_blank):
+        settings = _make_settings(
+            AI_MODELS=["model-a"],
+            OCR_MAX_SIDE=500,
+        )
+        provider = OcrProvider(settings)
+        provider._create_completion = MagicMock(return_value=_make_response("text"))
+        # Create image larger than OCR_MAX_SIDE
+        image = _make_test_image(width=1000, height=800)
+
+        provider.transcribe_image(image)
+
+        # Assert — the caller's image must NOT be mutated (copy is made internally)
+        assert image.size == (1000, 800)
+
+    @patch("ocr.provider.is_blank", return_value=False)
+    def test_small_image_not_resized(self, mock_is_blank):
+        settings = _make_settings(
+            AI_MODELS=["model-a"],
+            OCR_MAX_SIDE=2000,
+        )
+        provider = OcrProvider(settings)
+        provider._create_completion = MagicMock(return_value=_make_response("text"))
+        image = _make_test_image(width=100, height=100)
+
+        provider.transcribe_image(image)
+
+        assert image.size == (100, 100)
+
+    @patch("ocr.provider.is_blank", return_value=False)
+    def test_large_image_sent_at_max_side(self, mock_is_blank):
+        settings = _make_settings(AI_MODELS=["model-a"], OCR_MAX_SIDE=500)
+        provider = OcrProvider(settings)
+        provider._create_completion = MagicMock(return_value=_make_response("text"))
+
+        provider.transcribe_image(_make_test_image(width=1000, height=800))
+
+        url = _sent_image_url(provider)
+        sent = Image.open(BytesIO(base64.b64decode(url.split(",", 1)[1])))
+        assert sent.size == (500, 400)
+
+
+class TestOcrProviderSourcePassthrough:
+    def test_source_within_max_side_sent_verbatim(self):
+        settings = _make_settings(AI_MODELS=["model-a"], OCR_MAX_SIDE=2000)
+        provider = OcrProvider(settings)
+        provider._create_completion = MagicMock(return_value=_make_response("text"))
+        source = SourceImage(data=b"original-jpeg-bytes", content_type="image/jpeg")
+
+        provider.transcribe_image(_make_test_image(), source=source)
+
+        expected = base64.b64encode(b"original-jpeg-bytes").decode()
+        assert _sent_image_url(provider) == f"data:image/jpeg;base64,{expected}"
+
+    def test_oversized_source_is_resized_and_reencoded(self):
+        settings = _make_settings(AI_MODELS=["model-a"], OCR_MAX_SIDE=50)
+        provider = OcrProvider(settings)
+        provider._create_completion = MagicMock(return_value=_make_response("text"))
+        source = SourceImage(data=b"original-jpeg-bytes", content_type="image/jpeg")
+
+        provider.transcribe_image(_make_test_image(), source=source)
+
+        assert _sent_image_url(provider).startswith("data:image/png;base64,")
+
+    def test_blank_page_skipped_even_with_source(self):
+        settings = _make_settings(AI_MODELS=["model-a"])
+        provider = OcrProvider(settings)
+        provider._create_completion = MagicMock()
+        source = SourceImage(data=b"blank", content_type="image/png")
+
+        page = provider.transcribe_image(_make_blank_image(), source=source)
+
+        assert page.text == ""
+        provider._create_completion.assert_not_called()
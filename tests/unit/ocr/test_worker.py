@@ -7,12 +7,17 @@ the 500-line ceiling (CODE_GUIDELINES §3.1).
 
 from __future__ import annotations
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
 from PIL import Image
 
+from common.daemon_loop import _process_batch
 from ocr.image_converter import ImageConversionError
+from ocr.provider import OcrProviderUnavailableError
 from ocr.text_assembly import PageResult
 from ocr.worker import OcrProcessor
 from tests.helpers.factories import make_document, make_settings_obj
@@ -23,10 +28,10 @@ from tests.unit.ocr.conftest import make_image, make_processor
 class TestProcessHappyPath:
     @patch("ocr.worker.release_processing_tag")
     @patch("ocr.worker.claim_processing_tag", return_value=True)
-    @patch("ocr.worker.bytes_to_images")
+    @patch("ocr.worker.iter_pdf_pages")
     @patch("ocr.worker.assemble_full_text")
     def test_full_pipeline_success(
-        self, mock_assemble, mock_b2i, mock_claim, mock_release
+        self, mock_assemble, mock_pages, mock_claim, mock_release
     ):
         settings = make_settings_obj(
             OCR_PROCESSING_TAG_ID=999,
@@ -37,7 +42,7 @@ class TestProcessHappyPath:
         paperless.download_content.return_value = (b"pdf-data", "application/pdf")
 
         images = [make_image(), make_image()]
-        mock_b2i.return_value = images
+        mock_pages.return_value = images
 
         ocr_provider = make_mock_ocr_provider()
         ocr_provider.transcribe_image.side_effect = [
@@ -62,9 +67,10 @@ class TestProcessHappyPath:
         # Assert — full pipeline invoked with correct data flow
         mock_claim.assert_called_once()
         paperless.download_content.assert_called_once_with(1)
-        mock_b2i.assert_called_once()
+        mock_pages.assert_called_once()
         mock_assemble.assert_called_once()
-        mock_release.assert_called_once()
+        # The final update already dropped the lock tag; no release round trip
+        mock_release.assert_not_called()
         # Verify update_document called with correct content and tags
         paperless.update_document.assert_called_once()
         call_args = paperless.update_document.call_args[0]
@@ -73,6 +79,7 @@ class TestProcessHappyPath:
         tags = call_args[2]
         assert 444 in tags  # POST_TAG_ID added
         assert 443 not in tags  # PRE_TAG_ID removed
+        assert 999 not in tags  # OCR_PROCESSING_TAG_ID removed
 
 
 class TestProcessClaimFails:
@@ -150,6 +157,7 @@ class TestProcessImageConversionFailure:
         )
         paperless = make_mock_paperless()
         paperless.get_document.return_value = {"id": 1, "title": "T", "tags": [443]}
+        paperless.download_content.return_value = (b"not-an-image", "image/png")
         mock_clean.return_value = {552}
 
         proc = make_processor(paperless=paperless, settings=settings)
@@ -162,9 +170,9 @@ class TestProcessImageConversionFailure:
 class TestProcessAlwaysReleasesLock:
     @patch("ocr.worker.release_processing_tag")
     @patch("ocr.worker.claim_processing_tag", return_value=True)
-    @patch("ocr.worker.bytes_to_images")
+    @patch("ocr.worker.iter_pdf_pages")
     def test_lock_released_on_download_failure(
-        self, mock_b2i, mock_claim, mock_release
+        self, mock_pages, mock_claim, mock_release
     ):
         settings = make_settings_obj(OCR_PROCESSING_TAG_ID=999)
         paperless = make_mock_paperless()
@@ -180,13 +188,13 @@ class TestProcessAlwaysReleasesLock:
 
     @patch("ocr.worker.release_processing_tag")
     @patch("ocr.worker.claim_processing_tag", return_value=True)
-    @patch("ocr.worker.bytes_to_images")
-    def test_lock_released_on_ocr_failure(self, mock_b2i, mock_claim, mock_release):
+    @patch("ocr.worker.iter_pdf_pages")
+    def test_lock_released_on_ocr_failure(self, mock_pages, mock_claim, mock_release):
         settings = make_settings_obj(OCR_PROCESSING_TAG_ID=999)
         paperless = make_mock_paperless()
         paperless.get_document.return_value = {"id": 1, "title": "T", "tags": [443]}
         images = [make_image()]
-        mock_b2i.return_value = images
+        mock_pages.return_value = images
 
         ocr_provider = make_mock_ocr_provider()
         ocr_provider.transcribe_image.side_effect = Exception("OCR boom")
@@ -205,15 +213,15 @@ class TestProcessAlwaysReleasesLock:
 class TestImagesAlwaysClosed:
     @patch("ocr.worker.release_processing_tag")
     @patch("ocr.worker.claim_processing_tag", return_value=True)
-    @patch("ocr.worker.bytes_to_images")
+    @patch("ocr.worker.iter_pdf_pages")
     @patch("ocr.worker.assemble_full_text", return_value=("text", {"m"}))
     @patch("ocr.worker.get_latest_tags", return_value={443})
     def test_images_closed_on_success(
-        self, mock_tags, mock_assemble, mock_b2i, mock_claim, mock_release
+        self, mock_tags, mock_assemble, mock_pages, mock_claim, mock_release
     ):
         img1 = MagicMock(spec=Image.Image)
         img2 = MagicMock(spec=Image.Image)
-        mock_b2i.return_value = [img1, img2]
+        mock_pages.return_value = [img1, img2]
 
         settings = make_settings_obj(OCR_PROCESSING_TAG_ID=None)
         paperless = make_mock_paperless()
@@ -231,10 +239,10 @@ class TestImagesAlwaysClosed:
 
     @patch("ocr.worker.release_processing_tag")
     @patch("ocr.worker.claim_processing_tag", return_value=True)
-    @patch("ocr.worker.bytes_to_images")
-    def test_images_closed_on_ocr_error(self, mock_b2i, mock_claim, mock_release):
+    @patch("ocr.worker.iter_pdf_pages")
+    def test_images_closed_on_ocr_error(self, mock_pages, mock_claim, mock_release):
         img1 = MagicMock(spec=Image.Image)
-        mock_b2i.return_value = [img1]
+        mock_pages.return_value = [img1]
 
         settings = make_settings_obj(OCR_PROCESSING_TAG_ID=999)
         paperless = make_mock_paperless()
@@ -252,6 +260,93 @@ class TestImagesAlwaysClosed:
         img1.close.assert_called_once()
 
 
+class TestProcessProviderOutage:
+    @patch("ocr.worker.release_processing_tag")
+    @patch("ocr.worker.claim_processing_tag", return_value=True)
+    @patch("ocr.worker.iter_pdf_pages")
+    def test_outage_leaves_document_queued_and_flags_the_poll(
+        self, mock_pages, mock_claim, mock_release
+    ):
+        mock_pages.return_value = [make_image()]
+        ocr_provider = make_mock_ocr_provider()
+        ocr_provider.transcribe_image.side_effect = OcrProviderUnavailableError("down")
+        paperless = make_mock_paperless()
+        outage = threading.Event()
+        proc = OcrProcessor(
+            make_document(),
+            paperless,
+            ocr_provider,
+            make_settings_obj(),
+            provider_outage=outage,
+        )
+
+        proc.process()
+
+        # Assert — not raised, lock released, no error tag, batch flagged
+        mock_release.assert_called_once()
+        paperless.update_document.assert_not_called()
+        paperless.update_document_metadata.assert_not_called()
+        assert outage.is_set()
+
+    @patch("ocr.image_converter.convert_from_path")
+    @patch("ocr.image_converter.pdfinfo_from_path", return_value={"Pages": 30})
+    @patch("ocr.worker.release_processing_tag")
+    @patch("ocr.worker.claim_processing_tag", return_value=True)
+    def test_outage_mid_document_removes_pdf_and_closes_pages(
+        self, mock_claim, mock_release, mock_info, mock_convert
+    ):
+        chunk = [MagicMock(spec=Image.Image) for _ in range(10)]
+        mock_convert.return_value = chunk
+        ocr_provider = make_mock_ocr_provider()
+        ocr_provider.transcribe_image.side_effect = OcrProviderUnavailableError("down")
+        proc = make_processor(
+            ocr_provider=ocr_provider, settings=make_settings_obj(PAGE_WORKERS=1)
+        )
+
+        proc.process()
+
+        # Assert — the temp file is gone and every rendered page is closed
+        # before process() returns, not whenever the stream is collected
+        assert not os.path.exists(mock_info.call_args.args[0])
+        mock_convert.assert_called_once()
+        for image in chunk:
+            image.close.assert_called_once()
+
+    def test_skips_document_once_the_poll_is_flagged(self):
+        paperless = make_mock_paperless()
+        outage = threading.Event()
+        outage.set()
+        proc = OcrProcessor(
+            make_document(),
+            paperless,
+            make_mock_ocr_provider(),
+            make_settings_obj(),
+            provider_outage=outage,
+        )
+
+        proc.process()
+
+        paperless.get_document.assert_not_called()
+
+    @patch("common.daemon_loop.log")
+    @patch("ocr.worker.release_processing_tag")
+    @patch("ocr.worker.claim_processing_tag", return_value=True)
+    @patch("ocr.worker.iter_pdf_pages")
+    def test_daemon_loop_does_not_log_an_error(
+        self, mock_pages, mock_claim, mock_release, mock_loop_log
+    ):
+        mock_pages.return_value = [make_image()]
+        ocr_provider = make_mock_ocr_provider()
+        ocr_provider.transcribe_image.side_effect = OcrProviderUnavailableError("down")
+        proc = make_processor(ocr_provider=ocr_provider)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            _process_batch([proc.doc], lambda _doc: proc.process(), executor, "ocr")
+
+        mock_loop_log.exception.assert_not_called()
+        mock_loop_log.error.assert_not_called()
+
+
 class TestOcrProcessorInit:
     def test_extracts_doc_id(self):
         doc = make_document(id=42)
@@ -278,8 +373,8 @@ class TestOcrProcessorInit:
 class TestProcessNoPages:
     @patch("ocr.worker.release_processing_tag")
     @patch("ocr.worker.claim_processing_tag", return_value=True)
-    @patch("ocr.worker.bytes_to_images", return_value=[])
-    def test_no_pages_returns_early(self, mock_b2i, mock_claim, mock_release):
+    @patch("ocr.worker.iter_pdf_pages", return_value=[])
+    def test_no_pages_returns_early(self, mock_pages, mock_claim, mock_release):
         settings = make_settings_obj(OCR_PROCESSING_TAG_ID=999)
         paperless = make_mock_paperless()
         paperless.get_document.return_value = {"id": 1, "title": "T", "tags": [443]}
@@ -294,3 +389,39 @@ class TestProcessNoPages:
         ocr_provider.transcribe_image.assert_not_called()
         # Lock still released
         mock_release.assert_called_once()
+
+
+class TestProcessRasterisation:
+    @patch("ocr.worker.os.cpu_count", return_value=16)
+    @patch("ocr.worker.release_processing_tag")
+    @patch("ocr.worker.claim_processing_tag", return_value=True)
+    @patch("ocr.worker.iter_pdf_pages")
+    def test_pdf_rendered_with_page_workers(
+        self, mock_pages, mock_claim, mock_release, mock_cpus
+    ):
+        settings = make_settings_obj(PAGE_WORKERS=4, OCR_DPI=200, OCR_MAX_SIDE=1600)
+        mock_pages.return_value = [make_image()]
+        proc = make_processor(settings=settings)
+
+        proc.process()
+
+        assert mock_pages.call_args.kwargs == {
+            "dpi": 200,
+            "thread_count": 4,
+            "max_side": 1600,
+        }
+
+    @patch("ocr.worker.os.cpu_count", return_value=2)
+    @patch("ocr.worker.release_processing_tag")
+    @patch("ocr.worker.claim_processing_tag", return_value=True)
+    @patch("ocr.worker.iter_pdf_pages")
+    def test_render_processes_capped_at_cpu_count(
+        self, mock_pages, mock_claim, mock_release, mock_cpus
+    ):
+        settings = make_settings_obj(PAGE_WORKERS=8)
+        mock_pages.return_value = [make_image()]
+        proc = make_processor(settings=settings)
+
+        proc.process()
+
+        assert mock_pages.call_args.kwargs["thread_count"] == 2
@@ -7,14 +7,79 @@ for the 500-line ceiling (CODE_GUIDELINES §3.1).
 
 from __future__ import annotations
 
-from unittest.mock import patch
+from io import BytesIO
+from unittest.mock import MagicMock, patch
 
+import pytest
+from PIL import ExifTags, Image
+
+from ocr.provider import OcrProviderUnavailableError, SourceImage
 from ocr.text_assembly import OCR_ERROR_MARKER, PageResult
 from tests.helpers.factories import make_settings_obj
 from tests.helpers.mocks import make_mock_ocr_provider, make_mock_paperless
 from tests.unit.ocr.conftest import make_image, make_processor
 
 
+def _encode(image: Image.Image, fmt: str, *, orientation: int = 1) -> bytes:
+    """Encode *image* as *fmt*, tagging a non-upright EXIF *orientation*."""
+    exif = Image.Exif()
+    if orientation != 1:
+        exif[ExifTags.Base.Orientation] = orientation
+    buf = BytesIO()
+    image.save(buf, format=fmt, exif=exif)
+    return buf.getvalue()
+
+
+class TestDownloadAndConvertSource:
+    @pytest.mark.parametrize(
+        ("content", "content_type", "forwarded_as"),
+        [
+            pytest.param(
+                _encode(make_image(), "JPEG"), "image/jpeg", "image/jpeg", id="jpeg"
+            ),
+            pytest.param(
+                _encode(make_image(), "PNG"),
+                "image/jpeg",
+                "image/png",
+                id="mislabelled-png",
+            ),
+            pytest.param(
+                _encode(make_image(), "TIFF"), "image/png", None, id="mislabelled-tiff"
+            ),
+            pytest.param(
+                _encode(make_image(), "JPEG", orientation=6),
+                "image/jpeg",
+                None,
+                id="exif-rotated-jpeg",
+            ),
+        ],
+    )
+    def test_source_type_comes_from_the_bytes(
+        self, content, content_type, forwarded_as
+    ):
+        paperless = make_mock_paperless()
+        paperless.download_content.return_value = (content, content_type)
+        proc = make_processor(paperless=paperless)
+
+        _, source = proc._download_and_convert(set())
+
+        if forwarded_as is None:
+            assert source is None
+        else:
+            assert source == SourceImage(data=content, content_type=forwarded_as)
+
+    @patch("ocr.worker.iter_pdf_pages")
+    def test_pdf_pages_have_no_source(self, mock_pages):
+        paperless = make_mock_paperless()
+        paperless.download_content.return_value = (b"pdf-data", "application/pdf")
+        mock_pages.return_value = [make_image()]
+        proc = make_processor(paperless=paperless)
+
+        _, source = proc._download_and_convert(set())
+
+        assert source is None
+
+
 class TestOcrPagesInParallel:
     def test_preserves_page_order(self):
         # Arrange — single worker for deterministic side_effect ordering
@@ -54,6 +119,70 @@ class TestOcrPagesInParallel:
         assert 2 in failed  # page 2 (1-indexed)
         assert OCR_ERROR_MARKER in results[1].text
 
+    def test_closes_every_page_image_once_transcribed(self):
+        settings = make_settings_obj(PAGE_WORKERS=2)
+        ocr_provider = make_mock_ocr_provider()
+        ocr_provider.transcribe_image.side_effect = [
+            PageResult("Text page 1", "m"),
+            Exception("OCR failed on page 2"),
+        ]
+        proc = make_processor(ocr_provider=ocr_provider, settings=settings)
+        images = [MagicMock(spec=Image.Image), MagicMock(spec=Image.Image)]
+
+        proc._ocr_pages_in_parallel(images)
+
+        # Assert — a failed page is released just like a successful one
+        for image in images:
+            image.close.assert_called_once()
+
+    def test_provider_outage_aborts_remaining_pages(self):
+        settings = make_settings_obj(PAGE_WORKERS=1)
+        ocr_provider = make_mock_ocr_provider()
+        ocr_provider.transcribe_image.side_effect = [
+            OcrProviderUnavailableError("down"),
+            PageResult("Text page 2", "m"),
+            PageResult("Text page 3", "m"),
+        ]
+        proc = make_processor(ocr_provider=ocr_provider, settings=settings)
+        images = [MagicMock(spec=Image.Image) for _ in range(3)]
+
+        with pytest.raises(OcrProviderUnavailableError):
+            proc._ocr_pages_in_parallel(images)
+
+        # Assert — queued pages are closed (cancelled or not), never twice;
+        # the page beyond the queue is never pulled, let alone transcribed
+        images[0].close.assert_called_once()
+        images[1].close.assert_called_once()
+        images[2].close.assert_not_called()
+
+    def test_pulls_pages_only_as_workers_free_up(self):
+        settings = make_settings_obj(PAGE_WORKERS=1)
+        events: list[tuple[str, int]] = []
+        ocr_provider = make_mock_ocr_provider()
+
+        def transcribe(image, *, doc_id, page_num, source):
+            events.append(("ocr", page_num))
+            return PageResult(f"Text page {page_num}", "m")
+
+        ocr_provider.transcribe_image.side_effect = transcribe
+        proc = make_processor(ocr_provider=ocr_provider, settings=settings)
+
+        def pages():
+            for page_num in range(1, 6):
+                events.append(("pull", page_num))
+                yield make_image()
+
+        results, failed = proc._ocr_pages_in_parallel(pages())
+
+        # Assert — with one worker, at most two pages are queued: page N is
+        # only pulled once page N-2 has been transcribed
+        assert [r.text for r in results] == [f"Text page {n}" for n in range(1, 6)]
+        assert failed == []
+        for page_num in range(3, 6):
+            assert events.index(("pull", page_num)) > events.index(
+                ("ocr", page_num - 2)
+            )
+
     def test_empty_images_list(self):
         proc = make_processor()
 
@@ -90,38 +219,28 @@ class TestUpdatePaperlessDocumentHappy:
         assert 100 in tag_set  # user tag preserved
 
 
-class TestUpdatePaperlessDocumentErrors:
-    @patch("ocr.worker.get_latest_tags", return_value={443})
-    @patch("common.tags.clean_pipeline_tags", return_value=set())
-    def test_empty_text_marks_error(self, mock_clean, mock_get_tags):
-        settings = make_settings_obj(ERROR_TAG_ID=552)
-        paperless = make_mock_paperless()
-        proc = make_processor(paperless=paperless, settings=settings)
-
-        proc._update_paperless_document("   ", set())
-
-        # Assert — finalise_with_error calls update_document with error tag
-        paperless.update_document.assert_called_once()
-        tags_arg = paperless.update_document.call_args[0][2]
-        assert 552 in tags_arg
-
-    @patch("ocr.worker.get_latest_tags", return_value={443})
-    @patch("common.tags.clean_pipeline_tags", return_value=set())
-    def test_ocr_error_marker_in_text_marks_error(self, mock_clean, mock_get_tags):
-        settings = make_settings_obj(ERROR_TAG_ID=552)
+class TestCheckUsableText:
+    def test_good_text_is_usable(self):
         paperless = make_mock_paperless()
-        proc = make_processor(paperless=paperless, settings=settings)
+        proc = make_processor(paperless=paperless)
 
-        proc._update_paperless_document(f"Some text {OCR_ERROR_MARKER} more", {"m"})
-
-        # Assert — finalise_with_error calls update_document with error tag
-        paperless.update_document.assert_called_once()
-        tags_arg = paperless.update_document.call_args[0][2]
-        assert 552 in tags_arg
+        assert proc._check_usable_text("Good OCR text") is True
 
+        paperless.update_document.assert_not_called()
+        paperless.update_document_metadata.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            pytest.param("   ", id="empty-text"),
+            pytest.param(f"Some text {OCR_ERROR_MARKER} more", id="ocr-error"),
+            pytest.param("CHATGPT REFUSED TO TRANSCRIBE", id="refusal-mark"),
+            pytest.param("Name: [REDACTED]", id="redacted-marker"),
+        ],
+    )
     @patch("ocr.worker.get_latest_tags", return_value={443})
     @patch("common.tags.clean_pipeline_tags", return_value=set())
-    def test_refusal_mark_in_text_marks_error(self, mock_clean, mock_get_tags):
+    def test_bad_text_marks_error(self, mock_clean, mock_get_tags, text):
         settings = make_settings_obj(
             ERROR_TAG_ID=552,
             REFUSAL_MARK="CHATGPT REFUSED TO TRANSCRIBE",
@@ -129,21 +248,7 @@ class TestUpdatePaperlessDocumentErrors:
         paperless = make_mock_paperless()
         proc = make_processor(paperless=paperless, settings=settings)
 
-        proc._update_paperless_document("CHATGPT REFUSED TO TRANSCRIBE", set())
-
-        # Assert — finalise_with_error calls update_document with error tag
-        paperless.update_document.assert_called_once()
-        tags_arg = paperless.update_document.call_args[0][2]
-        assert 552 in tags_arg
-
-    @patch("ocr.worker.get_latest_tags", return_value={443})
-    @patch("common.tags.clean_pipeline_tags", return_value=set())
-    def test_redacted_marker_in_text_marks_error(self, mock_clean, mock_get_tags):
-        settings = make_settings_obj(ERROR_TAG_ID=552)
-        paperless = make_mock_paperless()
-        proc = make_processor(paperless=paperless, settings=settings)
-
-        proc._update_paperless_document("Name: [REDACTED]", {"m"})
+        assert proc._check_usable_text(text) is False
 
         # Assert — finalise_with_error calls update_document with error tag
         paperless.update_document.assert_called_once()